@@ -38,12 +38,6 @@ def upgrade() -> None:
     )
     op.create_index("ix_accounts_api_key", "accounts", ["api_key"])
 
-    field_type_enum = postgresql.ENUM(
-        "string", "number", "boolean", "datetime", "email", "phone",
-        name="fieldtype",
-        create_type=True,
-    )
-
     op.create_table(
         "custom_fields",
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
@@ -54,7 +48,9 @@ def upgrade() -> None:
             nullable=False,
         ),
         sa.Column("nombre_campo", sa.String(255), nullable=False),
-        sa.Column("tipo_dato", field_type_enum, server_default="string"),
+        # Created as varchar directly; installs that ran the original 001 got
+        # a native enum that 002 converts.
+        sa.Column("tipo_dato", sa.String(20), server_default="string"),
         sa.Column("descripcion", sa.String(500), nullable=True),
         sa.Column("es_requerido", sa.Boolean(), server_default=sa.text("false")),
         sa.Column(
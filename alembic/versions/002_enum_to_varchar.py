@@ -17,13 +17,19 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Convert column from enum to varchar, casting existing values
-    op.execute(
-        "ALTER TABLE custom_fields "
-        "ALTER COLUMN tipo_dato TYPE VARCHAR(20) USING tipo_dato::text"
-    )
-    # Drop the old enum type
-    op.execute("DROP TYPE IF EXISTS fieldtype")
+    # Convert column from enum to varchar, casting existing values, and drop
+    # the old enum type. Fresh installs already get a varchar from 001, so
+    # the table rewrite only happens where the enum actually exists.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_type WHERE typname = 'fieldtype') THEN
+                ALTER TABLE custom_fields
+                    ALTER COLUMN tipo_dato TYPE VARCHAR(20) USING tipo_dato::text;
+                DROP TYPE fieldtype;
+            END IF;
+        END $$
+    """)
 
 
 def downgrade() -> None:
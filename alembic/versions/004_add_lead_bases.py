@@ -70,7 +70,11 @@ def upgrade() -> None:
             nullable=True,
         ),
     )
-    op.create_index("ix_leads_lead_base_id", "leads", ["lead_base_id"])
+    # leads may already be large: build without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leads_lead_base_id", "leads", ["lead_base_id"], postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
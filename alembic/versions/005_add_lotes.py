@@ -55,7 +55,11 @@ def upgrade() -> None:
             nullable=True,
         ),
     )
-    op.create_index("ix_leads_lote_id", "leads", ["lote_id"])
+    # leads may already be large: build without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leads_lote_id", "leads", ["lote_id"], postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
@@ -8,33 +8,53 @@ Create Date: 2026-02-13 00:00:00.000000
 from typing import Sequence, Union
 
 import sqlalchemy as sa
-from alembic import op
+from alembic import context, op
 
 revision: str = "008"
 down_revision: Union[str, None] = "007"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Assign sequential id_lead per account ordered by created_at
+_BACKFILL_SQL = """
+    UPDATE leads
+    SET id_lead = sub.rn
+    FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (PARTITION BY cuenta_id ORDER BY created_at) AS rn
+        FROM leads
+        {where}
+    ) sub
+    WHERE leads.id = sub.id
+"""
+
 
 def upgrade() -> None:
     op.add_column(
         "leads",
         sa.Column("id_lead", sa.Integer(), nullable=True),
     )
-    op.create_index("ix_leads_id_lead", "leads", ["id_lead"])
-
-    # Backfill existing leads: assign sequential id_lead per account ordered by created_at
-    conn = op.get_bind()
-    conn.execute(sa.text("""
-        UPDATE leads
-        SET id_lead = sub.rn
-        FROM (
-            SELECT id,
-                   ROW_NUMBER() OVER (PARTITION BY cuenta_id ORDER BY created_at) AS rn
-            FROM leads
-        ) sub
-        WHERE leads.id = sub.id
-    """))
+
+    # Backfill one account per transaction (short row locks, bounded WAL
+    # per commit), and only build the index once the column is populated so
+    # the UPDATEs don't have to maintain it.
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            op.execute(_BACKFILL_SQL.format(where=""))
+        else:
+            conn = op.get_bind()
+            cuenta_ids = [
+                row[0] for row in conn.execute(sa.text("SELECT DISTINCT cuenta_id FROM leads"))
+            ]
+            for cuenta_id in cuenta_ids:
+                conn.execute(
+                    sa.text(_BACKFILL_SQL.format(where="WHERE cuenta_id = :cuenta_id")),
+                    {"cuenta_id": cuenta_id},
+                )
+
+        op.create_index(
+            "ix_leads_id_lead", "leads", ["id_lead"], postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
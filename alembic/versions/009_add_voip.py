@@ -16,6 +16,34 @@ down_revision: Union[str, None] = "008"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Built after the tables, outside the DDL transaction, with CONCURRENTLY so
+# the index builds never hold a write-blocking lock on the call tables.
+_INDEXES = [
+    ("ix_sip_providers_cuenta_id", "sip_providers", ["cuenta_id"]),
+    ("ix_sip_trunks_cuenta_id", "sip_trunks", ["cuenta_id"]),
+    ("ix_sip_trunks_provider_id", "sip_trunks", ["provider_id"]),
+    ("ix_pbx_nodes_cuenta_id", "pbx_nodes", ["cuenta_id"]),
+    ("ix_agents_cuenta_id", "agents", ["cuenta_id"]),
+    ("ix_agents_user_id", "agents", ["user_id"]),
+    ("ix_dispositions_cuenta_id", "dispositions", ["cuenta_id"]),
+    ("ix_campaigns_cuenta_id", "campaigns", ["cuenta_id"]),
+    ("ix_campaigns_estado", "campaigns", ["estado"]),
+    ("ix_campaign_agents_campaign_id", "campaign_agents", ["campaign_id"]),
+    ("ix_campaign_agents_agent_id", "campaign_agents", ["agent_id"]),
+    ("ix_campaign_leads_campaign_id", "campaign_leads", ["campaign_id"]),
+    ("ix_campaign_leads_lead_id", "campaign_leads", ["lead_id"]),
+    ("ix_campaign_leads_estado", "campaign_leads", ["estado"]),
+    ("ix_campaign_leads_proximo_intento", "campaign_leads", ["proximo_intento"]),
+    ("ix_call_records_cuenta_id", "call_records", ["cuenta_id"]),
+    ("ix_call_records_campaign_id", "call_records", ["campaign_id"]),
+    ("ix_call_records_agent_id", "call_records", ["agent_id"]),
+    ("ix_call_records_uniqueid", "call_records", ["uniqueid"]),
+    ("ix_call_records_created_at", "call_records", ["created_at"]),
+    ("ix_call_events_call_record_id", "call_events", ["call_record_id"]),
+    ("ix_dnc_entries_cuenta_id", "dnc_entries", ["cuenta_id"]),
+    ("ix_dnc_entries_telefono", "dnc_entries", ["telefono"]),
+]
+
 
 def upgrade() -> None:
     # SIP Providers
@@ -29,7 +57,6 @@ def upgrade() -> None:
         sa.Column("activo", sa.Boolean(), server_default="true"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_sip_providers_cuenta_id", "sip_providers", ["cuenta_id"])
 
     # SIP Trunks
     op.create_table(
@@ -52,8 +79,6 @@ def upgrade() -> None:
         sa.Column("activo", sa.Boolean(), server_default="true"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_sip_trunks_cuenta_id", "sip_trunks", ["cuenta_id"])
-    op.create_index("ix_sip_trunks_provider_id", "sip_trunks", ["provider_id"])
 
     # PBX Nodes
     op.create_table(
@@ -73,7 +98,6 @@ def upgrade() -> None:
         sa.Column("health_status", sa.String(20), server_default="unknown"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_pbx_nodes_cuenta_id", "pbx_nodes", ["cuenta_id"])
 
     # Agents
     op.create_table(
@@ -94,8 +118,6 @@ def upgrade() -> None:
         sa.Column("activo", sa.Boolean(), server_default="true"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_agents_cuenta_id", "agents", ["cuenta_id"])
-    op.create_index("ix_agents_user_id", "agents", ["user_id"])
 
     # Dispositions
     op.create_table(
@@ -111,7 +133,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.UniqueConstraint("cuenta_id", "codigo", name="uq_account_disposition_code"),
     )
-    op.create_index("ix_dispositions_cuenta_id", "dispositions", ["cuenta_id"])
 
     # Campaigns
     op.create_table(
@@ -141,8 +162,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_campaigns_cuenta_id", "campaigns", ["cuenta_id"])
-    op.create_index("ix_campaigns_estado", "campaigns", ["estado"])
 
     # Campaign Agents (M2M)
     op.create_table(
@@ -154,8 +173,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.UniqueConstraint("campaign_id", "agent_id", name="uq_campaign_agent"),
     )
-    op.create_index("ix_campaign_agents_campaign_id", "campaign_agents", ["campaign_id"])
-    op.create_index("ix_campaign_agents_agent_id", "campaign_agents", ["agent_id"])
 
     # Campaign Leads
     op.create_table(
@@ -176,10 +193,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.UniqueConstraint("campaign_id", "lead_id", name="uq_campaign_lead"),
     )
-    op.create_index("ix_campaign_leads_campaign_id", "campaign_leads", ["campaign_id"])
-    op.create_index("ix_campaign_leads_lead_id", "campaign_leads", ["lead_id"])
-    op.create_index("ix_campaign_leads_estado", "campaign_leads", ["estado"])
-    op.create_index("ix_campaign_leads_proximo_intento", "campaign_leads", ["proximo_intento"])
 
     # Call Records (CDR)
     op.create_table(
@@ -211,11 +224,6 @@ def upgrade() -> None:
         sa.Column("direccion", sa.String(10), server_default="outbound"),
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_call_records_cuenta_id", "call_records", ["cuenta_id"])
-    op.create_index("ix_call_records_campaign_id", "call_records", ["campaign_id"])
-    op.create_index("ix_call_records_agent_id", "call_records", ["agent_id"])
-    op.create_index("ix_call_records_uniqueid", "call_records", ["uniqueid"])
-    op.create_index("ix_call_records_created_at", "call_records", ["created_at"])
 
     # Call Events
     op.create_table(
@@ -226,7 +234,6 @@ def upgrade() -> None:
         sa.Column("detalle", JSONB(), nullable=True),
         sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now()),
     )
-    op.create_index("ix_call_events_call_record_id", "call_events", ["call_record_id"])
 
     # DNC Entries
     op.create_table(
@@ -238,8 +245,13 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
         sa.UniqueConstraint("cuenta_id", "telefono", name="uq_account_dnc_phone"),
     )
-    op.create_index("ix_dnc_entries_cuenta_id", "dnc_entries", ["cuenta_id"])
-    op.create_index("ix_dnc_entries_telefono", "dnc_entries", ["telefono"])
+
+    # Indexes
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True,
+            )
 
 
 def downgrade() -> None:
@@ -0,0 +1,40 @@
+"""Rebuild records.datos GIN index with jsonb_path_ops
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Payload lookups only use containment (datos @> '{...}'); jsonb_path_ops
+    # builds a much smaller index that still serves @>.
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_records_datos_gin", table_name="records", postgresql_concurrently=True)
+        op.create_index(
+            "ix_records_datos_gin",
+            "records",
+            ["datos"],
+            postgresql_using="gin",
+            postgresql_ops={"datos": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_datos_gin", table_name="records")
+    op.create_index(
+        "ix_records_datos_gin",
+        "records",
+        ["datos"],
+        postgresql_using="gin",
+    )
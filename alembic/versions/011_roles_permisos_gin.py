@@ -0,0 +1,30 @@
+"""Add GIN index on roles.permisos
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Permission checks are containment lookups (permisos @> '["leads:read"]')
+    op.create_index(
+        "ix_roles_permisos_gin",
+        "roles",
+        ["permisos"],
+        postgresql_using="gin",
+        postgresql_ops={"permisos": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_roles_permisos_gin", table_name="roles")
@@ -0,0 +1,34 @@
+"""Add partial GIN index on webhooks.eventos for active webhooks
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Inactive webhooks never fire, so they are left out of the index.
+    # The predicate matches the ORM filter (activo.is_(True)) verbatim so the
+    # planner can use it without having to prove implication.
+    op.create_index(
+        "ix_webhooks_eventos_gin",
+        "webhooks",
+        ["eventos"],
+        postgresql_using="gin",
+        postgresql_ops={"eventos": "jsonb_path_ops"},
+        postgresql_where=sa.text("activo IS TRUE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_webhooks_eventos_gin", table_name="webhooks")
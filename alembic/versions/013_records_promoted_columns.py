@@ -0,0 +1,50 @@
+"""Promote email / telefono / nombre from records.datos to columns
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored generated columns: Postgres fills them for existing rows while
+    # adding the column and keeps them in sync on every INSERT/UPDATE of
+    # datos, so no write path in the app has to know about them. Filling
+    # them rewrites records, so all three go in one ALTER (one rewrite).
+    op.execute(
+        "ALTER TABLE records "
+        "ADD COLUMN email TEXT GENERATED ALWAYS AS (lower(datos->>'email')) STORED, "
+        "ADD COLUMN telefono TEXT GENERATED ALWAYS AS "
+        "(COALESCE(datos->>'telefono', datos->>'phone')) STORED, "
+        "ADD COLUMN nombre TEXT GENERATED ALWAYS AS (datos->>'nombre') STORED"
+    )
+    # Partial: records whose payload has no such key need no index entry
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_records_cuenta_email", "records", ["cuenta_id", "email"],
+            postgresql_where=sa.text("email IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_records_cuenta_telefono", "records", ["cuenta_id", "telefono"],
+            postgresql_where=sa.text("telefono IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_cuenta_telefono", table_name="records")
+    op.drop_index("ix_records_cuenta_email", table_name="records")
+    op.drop_column("records", "nombre")
+    op.drop_column("records", "telefono")
+    op.drop_column("records", "email")
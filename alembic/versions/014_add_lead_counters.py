@@ -0,0 +1,42 @@
+"""Add per-account lead_counters for id_lead assignment
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lead_counters",
+        sa.Column(
+            "cuenta_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("accounts.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("next_id", sa.BigInteger(), nullable=False, server_default=sa.text("1")),
+    )
+
+    # Seed from the ids already handed out
+    op.execute("""
+        INSERT INTO lead_counters (cuenta_id, next_id)
+        SELECT cuenta_id, COALESCE(MAX(id_lead), 0) + 1
+        FROM leads
+        GROUP BY cuenta_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("lead_counters")
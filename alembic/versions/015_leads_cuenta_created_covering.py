@@ -0,0 +1,38 @@
+"""Replace single-column leads indexes with a (cuenta_id, created_at DESC) covering index
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves "WHERE cuenta_id = ? ORDER BY created_at DESC LIMIT n" in index
+    # order; the INCLUDE columns allow index-only scans for list views.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leads_cuenta_created",
+            "leads",
+            ["cuenta_id", sa.text("created_at DESC")],
+            postgresql_include=["id_lead", "lead_base_id", "lote_id"],
+            postgresql_concurrently=True,
+        )
+        # Both are covered by the leading columns of the new index
+        op.drop_index("ix_leads_cuenta_id", table_name="leads", postgresql_concurrently=True)
+        op.drop_index("ix_leads_created_at", table_name="leads", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_leads_created_at", "leads", ["created_at"])
+    op.create_index("ix_leads_cuenta_id", "leads", ["cuenta_id"])
+    op.drop_index("ix_leads_cuenta_created", table_name="leads")
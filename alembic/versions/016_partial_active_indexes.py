@@ -0,0 +1,50 @@
+"""Add partial indexes on active webhooks, automations and users
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Predicates are written as "activo IS TRUE" to match the ORM filters
+# (activo.is_(True)) verbatim.
+_ACTIVE = sa.text("activo IS TRUE")
+
+
+def upgrade() -> None:
+    # Webhook dispatch: cuenta_id + activo (the admin listing keeps using
+    # ix_webhooks_cuenta_id since it also shows inactive webhooks)
+    op.create_index(
+        "ix_webhooks_cuenta_id_active", "webhooks", ["cuenta_id"],
+        postgresql_where=_ACTIVE,
+    )
+
+    # run_automations: cuenta_id + trigger_tipo + activo
+    op.create_index(
+        "ix_automations_cuenta_trigger_active", "automations", ["cuenta_id", "trigger_tipo"],
+        postgresql_where=_ACTIVE,
+    )
+
+    # Users: account-wide lookups are already served by the leading column of
+    # uq_account_user_email / uq_account_username, so the plain index goes.
+    op.create_index(
+        "ix_users_cuenta_id_active", "users", ["cuenta_id"],
+        postgresql_where=_ACTIVE,
+    )
+    op.drop_index("ix_users_cuenta_id", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index("ix_users_cuenta_id", "users", ["cuenta_id"])
+    op.drop_index("ix_users_cuenta_id_active", table_name="users")
+    op.drop_index("ix_automations_cuenta_trigger_active", table_name="automations")
+    op.drop_index("ix_webhooks_cuenta_id_active", table_name="webhooks")
@@ -0,0 +1,48 @@
+"""Make users email uniqueness case-insensitive with a lower() index
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The old constraint was case-sensitive, so "Ana@x.com" and "ana@x.com"
+    # may both exist. They are separate logins with their own sessions and
+    # audit rows, so refuse to pick one silently: stop with the conflicts
+    # listed and let an operator merge or rename them.
+    op.execute(
+        "DO $$ DECLARE dupes text; BEGIN "
+        "SELECT string_agg(cuenta_id::text || ':' || email_lower, ', ') INTO dupes "
+        "FROM (SELECT cuenta_id, lower(email) AS email_lower FROM users "
+        "GROUP BY cuenta_id, lower(email) HAVING count(*) > 1) d; "
+        "IF dupes IS NOT NULL THEN RAISE EXCEPTION USING MESSAGE = "
+        "'users has emails differing only in case (cuenta_id:email): ' || dupes "
+        "|| '. Merge or rename them before running migration 017.'; "
+        "END IF; END $$"
+    )
+
+    # Functional unique index instead of CITEXT: no extension required, and
+    # lookups by lower(email) hit it directly.
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        ["cuenta_id", sa.text("lower(email)")],
+        unique=True,
+    )
+    op.drop_constraint("uq_account_user_email", "users", type_="unique")
+
+
+def downgrade() -> None:
+    op.create_unique_constraint("uq_account_user_email", "users", ["cuenta_id", "email"])
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,130 @@
+"""Partition webhook_logs and automation_logs by month on created_at
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions from the oldest existing row up to two months ahead.
+# Later months are created at startup by app.services.log_partitions.
+_CREATE_PARTITIONS_SQL = """
+DO $$
+DECLARE
+    m date;
+    last_month date := (date_trunc('month', now()) + interval '2 months')::date;
+BEGIN
+    SELECT date_trunc('month', COALESCE(MIN(created_at), now()))::date INTO m FROM {table}_old;
+    WHILE m <= last_month LOOP
+        EXECUTE 'CREATE TABLE IF NOT EXISTS ' || quote_ident('{table}_' || to_char(m, 'YYYY_MM'))
+            || ' PARTITION OF {table} FOR VALUES FROM (' || quote_literal(m)
+            || ') TO (' || quote_literal((m + interval '1 month')::date) || ')';
+        m := (m + interval '1 month')::date;
+    END LOOP;
+END $$
+"""
+
+_WEBHOOK_LOG_COLUMNS = "id, webhook_id, evento, payload, status_code, response_body, error, duration_ms, created_at"
+_AUTOMATION_LOG_COLUMNS = "id, automation_id, lead_id, trigger_evento, conditions_passed, actions_result, error, created_at"
+
+
+def _webhook_logs_columns() -> list:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "webhook_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("webhooks.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("evento", sa.String(100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("response_body", sa.Text(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("duration_ms", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _automation_logs_columns() -> list:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "automation_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("automations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("lead_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("trigger_evento", sa.String(50), nullable=False),
+        sa.Column("conditions_passed", sa.Boolean(), nullable=False),
+        sa.Column("actions_result", postgresql.JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _partition(table: str, columns: list, column_list: str, fk_column: str) -> None:
+    op.rename_table(table, f"{table}_old")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+    op.drop_index(f"ix_{table}_{fk_column}", table_name=f"{table}_old")
+    op.drop_index(f"ix_{table}_created_at", table_name=f"{table}_old")
+
+    # The partition key has to be part of the primary key
+    op.create_table(
+        table,
+        *columns,
+        sa.PrimaryKeyConstraint("id", "created_at", name=f"{table}_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute(_CREATE_PARTITIONS_SQL.format(table=table))
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table}_old")
+    op.drop_table(f"{table}_old")
+
+    op.create_index(f"ix_{table}_{fk_column}", table, [fk_column])
+    # Insert-only: created_at follows the physical row order, so BRIN serves
+    # time-range scans in a few pages (same as records in 020)
+    op.create_index(
+        f"ix_{table}_created_at_brin",
+        table,
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def _unpartition(table: str, columns: list, column_list: str, fk_column: str) -> None:
+    op.rename_table(table, f"{table}_old")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+    op.drop_index(f"ix_{table}_{fk_column}", table_name=f"{table}_old")
+    op.drop_index(f"ix_{table}_created_at_brin", table_name=f"{table}_old")
+
+    op.create_table(table, *columns, sa.PrimaryKeyConstraint("id", name=f"{table}_pkey"))
+    op.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {table}_old")
+    op.drop_table(f"{table}_old")
+
+    op.create_index(f"ix_{table}_{fk_column}", table, [fk_column])
+    op.create_index(f"ix_{table}_created_at", table, ["created_at"])
+
+
+def upgrade() -> None:
+    _partition("webhook_logs", _webhook_logs_columns(), _WEBHOOK_LOG_COLUMNS, "webhook_id")
+    _partition("automation_logs", _automation_logs_columns(), _AUTOMATION_LOG_COLUMNS, "automation_id")
+
+
+def downgrade() -> None:
+    _unpartition("automation_logs", _automation_logs_columns(), _AUTOMATION_LOG_COLUMNS, "automation_id")
+    _unpartition("webhook_logs", _webhook_logs_columns(), _WEBHOOK_LOG_COLUMNS, "webhook_id")
@@ -0,0 +1,50 @@
+"""Fold redundant single-column indexes into (cuenta_id, created_at DESC) composites
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # records: list_records filters by account and pages newest first
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_records_cuenta_created", "records", ["cuenta_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_records_cuenta_id", table_name="records", postgresql_concurrently=True)
+        op.drop_index("ix_records_created_at", table_name="records", postgresql_concurrently=True)
+
+    # lotes: same shape in list_lotes (ix_lotes_lead_base_id stays, it backs
+    # the ON DELETE SET NULL of lead_bases)
+    op.create_index(
+        "ix_lotes_cuenta_created", "lotes", ["cuenta_id", sa.text("created_at DESC")]
+    )
+    op.drop_index("ix_lotes_cuenta_id", table_name="lotes")
+    op.drop_index("ix_lotes_created_at", table_name="lotes")
+
+    # lead_bases: never filtered by created_at alone
+    op.drop_index("ix_lead_bases_created_at", table_name="lead_bases")
+
+
+def downgrade() -> None:
+    op.create_index("ix_lead_bases_created_at", "lead_bases", ["created_at"])
+
+    op.create_index("ix_lotes_created_at", "lotes", ["created_at"])
+    op.create_index("ix_lotes_cuenta_id", "lotes", ["cuenta_id"])
+    op.drop_index("ix_lotes_cuenta_created", table_name="lotes")
+
+    op.create_index("ix_records_created_at", "records", ["created_at"])
+    op.create_index("ix_records_cuenta_id", "records", ["cuenta_id"])
+    op.drop_index("ix_records_cuenta_created", table_name="records")
@@ -0,0 +1,38 @@
+"""Use BRIN indexes on created_at of append-only tables
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "020"
+down_revision: Union[str, None] = "019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Insert-only table: created_at follows the physical row order, so a BRIN
+# index of a few pages serves time-range scans that used to need a full btree.
+# The partitioned log tables get theirs when 018 recreates them.
+_BRIN_TABLES = ("records",)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in _BRIN_TABLES:
+            op.create_index(
+                f"ix_{table}_created_at_brin",
+                table,
+                ["created_at"],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    for table in _BRIN_TABLES:
+        op.drop_index(f"ix_{table}_created_at_brin", table_name=table)
@@ -0,0 +1,26 @@
+"""Replace routing_rules lead_base_id index with (lead_base_id, prioridad)
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "021"
+down_revision: Union[str, None] = "020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rules are always read per base in priority order
+    op.create_index("ix_routing_rules_lb_prio", "routing_rules", ["lead_base_id", "prioridad"])
+    op.drop_index("ix_routing_rules_lead_base_id", table_name="routing_rules")
+
+
+def downgrade() -> None:
+    op.create_index("ix_routing_rules_lead_base_id", "routing_rules", ["lead_base_id"])
+    op.drop_index("ix_routing_rules_lb_prio", table_name="routing_rules")
@@ -0,0 +1,35 @@
+"""Use lz4 TOAST compression for log and config payload columns
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding large JSON/text blobs. Requires PG14+ built
+# with lz4; only newly written values are compressed with the new method.
+_COLUMNS = (
+    ("webhook_logs", "payload"),
+    ("webhook_logs", "response_body"),
+    ("automation_logs", "actions_result"),
+    ("automations", "trigger_config"),
+    ("automation_actions", "config"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
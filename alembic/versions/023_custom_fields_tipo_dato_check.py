@@ -0,0 +1,28 @@
+"""Add CHECK constraint on custom_fields.tipo_dato
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same value set the old fieldtype enum enforced
+    op.create_check_constraint(
+        "ck_custom_fields_tipo_dato",
+        "custom_fields",
+        "tipo_dato IN ('string', 'number', 'boolean', 'datetime', 'email', 'phone')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_custom_fields_tipo_dato", "custom_fields", type_="check")
@@ -0,0 +1,25 @@
+"""Drop ix_accounts_api_key, duplicated by the api_key UNIQUE constraint
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "024"
+down_revision: Union[str, None] = "023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # accounts_api_key_key (the UNIQUE constraint) already serves the
+    # equality lookup done on every ingest
+    op.drop_index("ix_accounts_api_key", table_name="accounts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_accounts_api_key", "accounts", ["api_key"])
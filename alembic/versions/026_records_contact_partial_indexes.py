@@ -0,0 +1,24 @@
+"""Make records email/telefono indexes partial on non-null values (folded into 013)
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+revision: str = "026"
+down_revision: Union[str, None] = "025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 013 now builds ix_records_cuenta_email / ix_records_cuenta_telefono as
+    # partial indexes directly; rebuilding them here would index records
+    # twice on every deploy. Kept as a no-op so the revision chain holds.
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,30 @@
+"""Add partial index on automation_logs.lead_id
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "027"
+down_revision: Union[str, None] = "026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lead -> log lookups; runs without a lead (NULL) are not indexed
+    op.create_index(
+        "ix_automation_logs_lead_id",
+        "automation_logs",
+        ["lead_id"],
+        postgresql_where=sa.text("lead_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_automation_logs_lead_id", table_name="automation_logs")
@@ -0,0 +1,50 @@
+"""Composite indexes for dialer and CDR access paths
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "028"
+down_revision: Union[str, None] = "027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dialer "next lead" lookups filter campaign_id + estado and range over
+# proximo_intento; CDR listings filter cuenta_id / campaign_id and sort by
+# created_at DESC.
+_COMPOSITES = [
+    ("ix_campaign_leads_campaign_estado_next", "campaign_leads", ["campaign_id", "estado", "proximo_intento"]),
+    ("ix_call_records_cuenta_created", "call_records", ["cuenta_id", sa.text("created_at DESC")]),
+    ("ix_call_records_campaign_created", "call_records", ["campaign_id", sa.text("created_at DESC")]),
+]
+
+# Prefixes of the composites above (campaign_id is also the leading column
+# of uq_campaign_lead).
+_REDUNDANT = [
+    ("ix_campaign_leads_campaign_id", "campaign_leads", ["campaign_id"]),
+    ("ix_campaign_leads_estado", "campaign_leads", ["estado"]),
+    ("ix_call_records_cuenta_id", "call_records", ["cuenta_id"]),
+    ("ix_call_records_campaign_id", "call_records", ["campaign_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _COMPOSITES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, table, _ in _REDUNDANT:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REDUNDANT:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, table, _ in _COMPOSITES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,61 @@
+"""DNC digits index and VoIP foreign-key indexes
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "029"
+down_revision: Union[str, None] = "028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# FK columns without an index: ON DELETE SET NULL from the parent would
+# otherwise seq-scan the child table.
+_FK_INDEXES = [
+    ("ix_campaign_leads_disposition_id", "campaign_leads", ["disposition_id"]),
+    ("ix_campaign_leads_assigned_agent_id", "campaign_leads", ["assigned_agent_id"]),
+    ("ix_call_records_campaign_lead_id", "call_records", ["campaign_lead_id"]),
+    ("ix_call_records_trunk_id", "call_records", ["trunk_id"]),
+    ("ix_call_records_disposition_id", "call_records", ["disposition_id"]),
+    ("ix_agents_pbx_node_id", "agents", ["pbx_node_id"]),
+    ("ix_campaigns_trunk_id", "campaigns", ["trunk_id"]),
+    ("ix_campaigns_pbx_node_id", "campaigns", ["pbx_node_id"]),
+]
+
+# uq_account_dnc_phone already indexes (cuenta_id, telefono)
+_REDUNDANT = [
+    ("ix_dnc_entries_cuenta_id", "dnc_entries", ["cuenta_id"]),
+    ("ix_dnc_entries_telefono", "dnc_entries", ["telefono"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _FK_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        # Dialer DNC check compares digits only (see dialer_engine.is_dnc)
+        op.create_index(
+            "ix_dnc_entries_cuenta_tel_digits",
+            "dnc_entries",
+            ["cuenta_id", sa.text("regexp_replace(telefono, '\\D', '', 'g')")],
+            postgresql_concurrently=True,
+        )
+        for name, table, _ in _REDUNDANT:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REDUNDANT:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        op.drop_index(
+            "ix_dnc_entries_cuenta_tel_digits", table_name="dnc_entries", postgresql_concurrently=True,
+        )
+        for name, table, _ in _FK_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,36 @@
+"""Index for keyset pagination of active accounts
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "030"
+down_revision: Union[str, None] = "029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Soft-deleted accounts are never listed; keep them out of the index
+    # instead of carrying the two-valued activo as its leading column.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_accounts_active_created",
+            "accounts",
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_where=sa.text("activo IS TRUE"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_accounts_active_created", table_name="accounts", postgresql_concurrently=True,
+        )
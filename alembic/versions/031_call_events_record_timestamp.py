@@ -0,0 +1,45 @@
+"""Composite (call_record_id, timestamp) index on call_events
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "031"
+down_revision: Union[str, None] = "030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Call timelines are read as call_record_id = ? ORDER BY timestamp; the
+    # composite also serves the FK cascade, so the single-column one goes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_call_events_call_record_id_timestamp",
+            "call_events",
+            ["call_record_id", "timestamp"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_call_events_call_record_id", table_name="call_events", postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_call_events_call_record_id",
+            "call_events",
+            ["call_record_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_call_events_call_record_id_timestamp",
+            table_name="call_events",
+            postgresql_concurrently=True,
+        )
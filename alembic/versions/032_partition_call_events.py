@@ -0,0 +1,100 @@
+"""Partition call_events by month on timestamp
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "032"
+down_revision: Union[str, None] = "031"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same layout as the log tables in 018: monthly partitions from the oldest
+# row up to two months ahead, later ones created by app.services.log_partitions.
+_CREATE_PARTITIONS_SQL = """
+DO $$
+DECLARE
+    m date;
+    last_month date := (date_trunc('month', now()) + interval '2 months')::date;
+BEGIN
+    SELECT date_trunc('month', COALESCE(MIN("timestamp"), now()))::date INTO m FROM call_events_old;
+    WHILE m <= last_month LOOP
+        EXECUTE 'CREATE TABLE IF NOT EXISTS ' || quote_ident('call_events_' || to_char(m, 'YYYY_MM'))
+            || ' PARTITION OF call_events FOR VALUES FROM (' || quote_literal(m)
+            || ') TO (' || quote_literal((m + interval '1 month')::date) || ')';
+        m := (m + interval '1 month')::date;
+    END LOOP;
+END $$
+"""
+
+_COLUMNS = 'id, call_record_id, evento, detalle, "timestamp"'
+
+
+def _columns() -> list:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "call_record_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("call_records.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("evento", sa.String(50), nullable=False),
+        sa.Column("detalle", postgresql.JSONB(), nullable=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _rename_old() -> None:
+    op.rename_table("call_events", "call_events_old")
+    op.execute("ALTER INDEX call_events_pkey RENAME TO call_events_old_pkey")
+    op.drop_index("ix_call_events_call_record_id_timestamp", table_name="call_events_old")
+
+
+def upgrade() -> None:
+    # call_records stays a plain table: call_events references call_records.id,
+    # and a partitioned call_records could only be referenced by (id, created_at).
+    _rename_old()
+
+    # The partition key has to be part of the primary key
+    op.create_table(
+        "call_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="call_events_pkey"),
+        postgresql_partition_by='RANGE ("timestamp")',
+    )
+    op.execute(_CREATE_PARTITIONS_SQL)
+    op.execute("CREATE TABLE call_events_default PARTITION OF call_events DEFAULT")
+
+    op.execute(
+        f"INSERT INTO call_events ({_COLUMNS}) "
+        'SELECT id, call_record_id, evento, detalle, COALESCE("timestamp", now()) FROM call_events_old'
+    )
+    op.drop_table("call_events_old")
+
+    op.create_index(
+        "ix_call_events_call_record_id_timestamp", "call_events", ["call_record_id", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    _rename_old()
+
+    op.create_table(
+        "call_events",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", name="call_events_pkey"),
+    )
+    op.execute(f"INSERT INTO call_events ({_COLUMNS}) SELECT {_COLUMNS} FROM call_events_old")
+    op.drop_table("call_events_old")
+
+    op.create_index(
+        "ix_call_events_call_record_id_timestamp", "call_events", ["call_record_id", "timestamp"],
+    )
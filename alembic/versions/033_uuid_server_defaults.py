@@ -0,0 +1,51 @@
+"""Server-side gen_random_uuid() defaults on random-UUID primary keys
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "033"
+down_revision: Union[str, None] = "032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# gen_random_uuid() is built in since PostgreSQL 13, no pgcrypto needed.
+# Append-heavy tables (records, leads, *_logs, call_*) keep their app-side
+# UUIDv7 ids so the PK index stays right-leaning.
+_TABLES = [
+    "accounts",
+    "users",
+    "roles",
+    "custom_fields",
+    "lead_bases",
+    "lotes",
+    "routing_rules",
+    "webhooks",
+    "automations",
+    "automation_conditions",
+    "automation_actions",
+    "sip_providers",
+    "sip_trunks",
+    "pbx_nodes",
+    "agents",
+    "dispositions",
+    "campaigns",
+    "campaign_agents",
+    "campaign_leads",
+    "dnc_entries",
+]
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
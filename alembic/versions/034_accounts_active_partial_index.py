@@ -0,0 +1,24 @@
+"""Partial index for listing active accounts (folded into 030)
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+revision: str = "034"
+down_revision: Union[str, None] = "033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 030 now creates the partial ix_accounts_active_created directly instead
+    # of an (activo, created_at, id) index this revision swapped out. Kept as
+    # a no-op so the revision chain holds.
+    pass
+
+
+def downgrade() -> None:
+    pass
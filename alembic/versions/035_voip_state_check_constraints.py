@@ -0,0 +1,70 @@
+"""CHECK constraints on VoIP state/mode string columns
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "035"
+down_revision: Union[str, None] = "034"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Value sets mirror the enums in app.models.voip
+_CHECKS = [
+    ("ck_sip_trunks_transport", "sip_trunks", "transport", ("udp", "tcp", "tls")),
+    ("ck_agents_estado", "agents", "estado", (
+        "offline", "available", "busy", "ringing", "on_call", "wrap_up", "paused",
+    )),
+    ("ck_campaigns_estado", "campaigns", "estado", ("draft", "running", "paused", "completed", "stopped")),
+    ("ck_campaigns_dialer_mode", "campaigns", "dialer_mode", ("manual", "progressive", "predictive")),
+    ("ck_campaign_leads_estado", "campaign_leads", "estado", (
+        "pending", "dialing", "contacted", "no_answer", "busy",
+        "failed", "dnc", "scheduled", "completed", "abandoned",
+    )),
+    ("ck_call_records_resultado", "call_records", "resultado", (
+        "pending", "answered", "no_answer", "busy", "failed",
+        "congestion", "abandoned", "rejected", "timeout",
+    )),
+    ("ck_call_records_direccion", "call_records", "direccion", ("outbound", "inbound")),
+]
+
+
+def upgrade() -> None:
+    # These columns were written without validation: normalise case and
+    # whitespace first, so VALIDATE below cannot trip over "UDP" or " Running".
+    # Any other value is real data (a call outcome, a lead's dial state) that
+    # must not be rewritten to a default, so stop and list it instead.
+    for name, table, column, values in _CHECKS:
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.execute(
+            f"UPDATE {table} SET {column} = lower(btrim({column})) "
+            f"WHERE {column} <> lower(btrim({column}))"
+        )
+        op.execute(
+            "DO $$ DECLARE bad text; BEGIN "
+            f"SELECT string_agg(DISTINCT quote_literal({column}), ', ') INTO bad "
+            f"FROM {table} WHERE {column} NOT IN ({allowed}); "
+            "IF bad IS NOT NULL THEN RAISE EXCEPTION USING MESSAGE = "
+            f"'{table}.{column} has values outside ({', '.join(values)}): ' || bad "
+            "|| '. Map them to an allowed value before running migration 035.'; "
+            "END IF; END $$"
+        )
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({column} IN ({allowed})) NOT VALID")
+
+    # NOT VALID + VALIDATE: the ADDs above (and the UPDATEs before them) run
+    # in the migration transaction and hold ACCESS EXCLUSIVE until it
+    # commits; the scans of existing rows then run in their own transactions
+    # under SHARE UPDATE EXCLUSIVE, so writes keep going.
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in _CHECKS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(_CHECKS):
+        op.drop_constraint(name, table, type_="check")
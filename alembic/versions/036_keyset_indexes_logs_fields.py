@@ -0,0 +1,50 @@
+"""Keyset pagination indexes for automation_logs and custom_fields
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "036"
+down_revision: Union[str, None] = "035"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partitioned (018): no CONCURRENTLY, the index is built per partition
+    op.create_index(
+        "ix_automation_logs_automation_created",
+        "automation_logs",
+        ["automation_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("ix_automation_logs_automation_id", table_name="automation_logs")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_custom_fields_cuenta_created",
+            "custom_fields",
+            ["cuenta_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_custom_fields_cuenta_id", table_name="custom_fields", postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_custom_fields_cuenta_id", "custom_fields", ["cuenta_id"], postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_custom_fields_cuenta_created", table_name="custom_fields", postgresql_concurrently=True,
+        )
+
+    op.create_index("ix_automation_logs_automation_id", "automation_logs", ["automation_id"])
+    op.drop_index("ix_automation_logs_automation_created", table_name="automation_logs")
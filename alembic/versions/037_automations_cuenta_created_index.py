@@ -0,0 +1,40 @@
+"""Composite (cuenta_id, created_at DESC) index for automations
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "037"
+down_revision: Union[str, None] = "036"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_automations_cuenta_created",
+            "automations",
+            ["cuenta_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        # The leading column of the new index serves the same lookups
+        op.drop_index(
+            "ix_automations_cuenta_id", table_name="automations", postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_automations_cuenta_id", "automations", ["cuenta_id"], postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_automations_cuenta_created", table_name="automations", postgresql_concurrently=True,
+        )
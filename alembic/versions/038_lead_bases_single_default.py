@@ -0,0 +1,43 @@
+"""At most one default lead base per account
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "038"
+down_revision: Union[str, None] = "037"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Earlier races could leave several defaults; keep the oldest per account
+    op.execute(
+        "UPDATE lead_bases SET es_default = false "
+        "WHERE es_default IS TRUE AND id NOT IN ("
+        "SELECT DISTINCT ON (cuenta_id) id FROM lead_bases "
+        "WHERE es_default IS TRUE ORDER BY cuenta_id, created_at, id)"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_lead_bases_default_per_account",
+            "lead_bases",
+            ["cuenta_id"],
+            unique=True,
+            postgresql_where=sa.text("es_default IS TRUE"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_lead_bases_default_per_account", table_name="lead_bases", postgresql_concurrently=True,
+        )
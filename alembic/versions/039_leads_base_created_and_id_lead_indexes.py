@@ -0,0 +1,48 @@
+"""Composite indexes for per-base lead listings and id_lead lookups
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "039"
+down_revision: Union[str, None] = "038"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Leads by base are paged newest-first; bulk updates and the id_lead counter
+# look leads up by (cuenta_id, id_lead). (cuenta_id, created_at DESC) already
+# exists as ix_leads_cuenta_created (015), and the single default base per
+# account is covered by uq_lead_bases_default_per_account (038).
+_COMPOSITES = [
+    ("ix_leads_lead_base_created", "leads", ["lead_base_id", sa.text("created_at DESC")]),
+    ("ix_leads_cuenta_id_lead", "leads", ["cuenta_id", "id_lead"]),
+]
+
+# ix_leads_lead_base_id is a prefix of the first composite; id_lead is never
+# searched without its account.
+_REDUNDANT = [
+    ("ix_leads_lead_base_id", "leads", ["lead_base_id"]),
+    ("ix_leads_id_lead", "leads", ["id_lead"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _COMPOSITES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, table, _ in _REDUNDANT:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REDUNDANT:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+        for name, table, _ in _COMPOSITES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""Import status on lotes
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "040"
+down_revision: Union[str, None] = "039"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Constant default: a catalog-only change, existing lotes read as
+    # completed without rewriting the table.
+    op.add_column(
+        "lotes",
+        sa.Column("estado", sa.String(20), nullable=False, server_default="completed"),
+    )
+    op.create_check_constraint(
+        "ck_lotes_estado", "lotes", "estado IN ('pending', 'completed', 'failed')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_lotes_estado", "lotes", type_="check")
+    op.drop_column("lotes", "estado")
@@ -2,9 +2,12 @@ import secrets
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import insert, select, tuple_, update
 from sqlalchemy.orm import Session
 
+from app.core.caching import account_cache, api_key_cache
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import verify_admin_key
 from app.models.account import Account
 from app.schemas.account import (
@@ -21,10 +24,20 @@ def _generate_api_key() -> str:
     return f"cc_{secrets.token_urlsafe(32)}"
 
 
-def _get_account_or_404(db: Session, account_id: uuid.UUID) -> Account:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+def _update_account_returning(db: Session, account_id: uuid.UUID, **values) -> AccountResponse:
+    """UPDATE ... RETURNING in one round-trip; 404 when no row matched."""
+    table = Account.__table__
+    if values:
+        stmt = update(table).where(table.c.id == account_id).values(**values).returning(table)
+    else:
+        stmt = select(table).where(table.c.id == account_id)
+    with db.begin():
+        row = db.execute(stmt).mappings().first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Account not found")
+        account = AccountResponse.model_validate(row)
+    account_cache.pop(account_id)
+    api_key_cache.pop(account.api_key)
     return account
 
 
@@ -37,16 +50,18 @@ def _get_account_or_404(db: Session, account_id: uuid.UUID) -> Account:
 def create_account(
     data: AccountCreate,
     db: Session = Depends(get_db),
-) -> Account:
-    account = Account(
-        nombre=data.nombre,
-        api_key=_generate_api_key(),
-        auto_crear_campos=data.auto_crear_campos,
-    )
-    db.add(account)
-    db.commit()
-    db.refresh(account)
-    return account
+) -> AccountResponse:
+    with db.begin():
+        row = db.execute(
+            insert(Account.__table__)
+            .values(
+                nombre=data.nombre,
+                api_key=_generate_api_key(),
+                auto_crear_campos=data.auto_crear_campos,
+            )
+            .returning(Account.__table__)
+        ).mappings().one()
+        return AccountResponse.model_validate(row)
 
 
 @router.get(
@@ -55,19 +70,21 @@ def create_account(
     summary="List all accounts",
 )
 def list_accounts(
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    query = db.query(Account).filter(Account.activo.is_(True))
-    total = query.count()
-    items = (
-        query.order_by(Account.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
-    return {"items": items, "total": total}
+    # Plain row mappings: nothing here needs identity-map / instrumentation
+    stmt = select(Account.__table__).where(Account.activo.is_(True))
+    if cursor:
+        stmt = stmt.where(tuple_(Account.created_at, Account.id) < decode_cursor(cursor))
+    stmt = stmt.order_by(Account.created_at.desc(), Account.id.desc()).limit(limit + 1)
+    items = db.execute(stmt).mappings().all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1]["created_at"], items[-1]["id"])
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.get(
@@ -78,8 +95,17 @@ def list_accounts(
 def get_account(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
-) -> Account:
-    return _get_account_or_404(db, account_id)
+) -> AccountResponse:
+    cached = account_cache.get(account_id)
+    if cached is None:
+        row = db.execute(
+            select(Account.__table__).where(Account.id == account_id)
+        ).mappings().first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Account not found")
+        cached = AccountResponse.model_validate(row)
+        account_cache.set(account_id, cached)
+    return cached
 
 
 @router.put(
@@ -91,14 +117,8 @@ def update_account(
     account_id: uuid.UUID,
     data: AccountUpdate,
     db: Session = Depends(get_db),
-) -> Account:
-    account = _get_account_or_404(db, account_id)
-    update_data = data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(account, key, value)
-    db.commit()
-    db.refresh(account)
-    return account
+) -> AccountResponse:
+    return _update_account_returning(db, account_id, **data.model_dump(exclude_unset=True))
 
 
 @router.delete(
@@ -110,9 +130,7 @@ def delete_account(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    account = _get_account_or_404(db, account_id)
-    account.activo = False
-    db.commit()
+    _update_account_returning(db, account_id, activo=False)
 
 
 @router.patch(
@@ -123,9 +141,7 @@ def delete_account(
 def toggle_auto_create(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
-) -> Account:
-    account = _get_account_or_404(db, account_id)
-    account.auto_crear_campos = not account.auto_crear_campos
-    db.commit()
-    db.refresh(account)
-    return account
+) -> AccountResponse:
+    return _update_account_returning(
+        db, account_id, auto_crear_campos=~Account.__table__.c.auto_crear_campos,
+    )
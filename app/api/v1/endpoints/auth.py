@@ -1,9 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.auth import create_access_token, get_current_user, verify_password
+from app.core.caching import failed_login_cache
 from app.core.database import get_db
 from app.models.role import Role
 from app.models.user import User
@@ -12,39 +14,55 @@ from app.schemas.user import LoginRequest, LoginResponse, UserResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Failed attempts per (ip, account, username) within failed_login_cache's TTL
+# before bcrypt is skipped altogether
+MAX_FAILED_LOGINS = 10
+
 
 @router.post(
     "/auth/login",
     response_model=LoginResponse,
     summary="Login and obtain JWT token",
 )
-def login(
+async def login(
     body: LoginRequest,
+    request: Request,
     db: Session = Depends(get_db),
-) -> dict:
-    user = (
-        db.query(User)
+) -> LoginResponse:
+    attempt_key = (request.client.host if request.client else None, body.cuenta_id, body.username)
+    if failed_login_cache.get(attempt_key, 0) >= MAX_FAILED_LOGINS:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid username or password",
+        )
+
+    query = (
+        db.query(User, Role)
+        .outerjoin(Role, Role.id == User.role_id)
         .filter(
             User.username == body.username,
             User.cuenta_id == body.cuenta_id,
             User.activo.is_(True),
         )
-        .first()
     )
-    if not user or not verify_password(body.password, user.password_hash):
+    row = await run_in_threadpool(query.first)
+    user, role = row if row else (None, None)
+    # bcrypt costs ~100 ms of CPU but releases the GIL, so concurrent logins
+    # hash in parallel on the threadpool without blocking the event loop.
+    # Unknown users are checked against a dummy hash to take the same time.
+    password_ok = await run_in_threadpool(
+        verify_password, body.password, user.password_hash if user else None,
+    )
+    if not user or not password_ok:
+        failed_login_cache.set(attempt_key, failed_login_cache.get(attempt_key, 0) + 1)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
+    failed_login_cache.pop(attempt_key)
 
     # Gather permissions from role
-    permisos: list[str] = []
-    role_nombre: str | None = None
-    if user.role_id:
-        role = db.query(Role).filter(Role.id == user.role_id).first()
-        if role:
-            permisos = role.permisos or []
-            role_nombre = role.nombre
+    permisos: list[str] = (role.permisos or []) if role else []
 
     token = create_access_token(
         user_id=user.id,
@@ -55,23 +73,8 @@ def login(
 
     logger.info("User '%s' logged in (account %s)", user.username, user.cuenta_id)
 
-    return {
-        "access_token": token,
-        "token_type": "bearer",
-        "user": {
-            "id": user.id,
-            "cuenta_id": user.cuenta_id,
-            "nombre": user.nombre,
-            "apellido": user.apellido,
-            "email": user.email,
-            "username": user.username,
-            "role_id": user.role_id,
-            "role_nombre": role_nombre,
-            "activo": user.activo,
-            "created_at": user.created_at,
-            "updated_at": user.updated_at,
-        },
-    }
+    # user.role resolves from the identity map (the Role row came with the join)
+    return LoginResponse(access_token=token, user=UserResponse.model_validate(user))
 
 
 @router.get(
@@ -81,24 +84,6 @@ def login(
 )
 def get_me(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> dict:
-    role_nombre = None
-    if current_user.role_id:
-        role = db.query(Role).filter(Role.id == current_user.role_id).first()
-        if role:
-            role_nombre = role.nombre
-
-    return {
-        "id": current_user.id,
-        "cuenta_id": current_user.cuenta_id,
-        "nombre": current_user.nombre,
-        "apellido": current_user.apellido,
-        "email": current_user.email,
-        "username": current_user.username,
-        "role_id": current_user.role_id,
-        "role_nombre": role_nombre,
-        "activo": current_user.activo,
-        "created_at": current_user.created_at,
-        "updated_at": current_user.updated_at,
-    }
+) -> UserResponse:
+    # role is eager-loaded by get_current_user
+    return UserResponse.model_validate(current_user)
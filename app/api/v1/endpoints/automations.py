@@ -1,12 +1,14 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, insert, tuple_
+from sqlalchemy.orm import Query as ORMQuery
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.automation import (
     Automation,
     AutomationAction,
@@ -28,6 +30,7 @@ from app.schemas.automation import (
     ConditionCreate,
     ConditionResponse,
 )
+from app.services.account_lookup import assert_account_exists
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
@@ -35,31 +38,42 @@ router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
-def _validate_trigger(tipo: str) -> None:
-    if tipo not in TRIGGER_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid trigger: {tipo}. Valid: {', '.join(TRIGGER_TYPES)}",
-        )
-
-
-def _validate_action_type(tipo: str) -> None:
-    if tipo not in ACTION_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid action type: {tipo}. Valid: {', '.join(ACTION_TYPES)}",
-        )
+def _assert_automation_exists(db: Session, automation_id: uuid.UUID) -> None:
+    if db.query(Automation.id).filter(Automation.id == automation_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Automation not found")
 
 
-def _validate_operator(op: str) -> None:
-    if op not in CONDITION_OPERATORS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid operator: {op}. Valid: {', '.join(CONDITION_OPERATORS)}",
-        )
+def _automations_with_children(db: Session) -> ORMQuery:
+    """Automation query that loads conditions/actions in two IN (...) batches;
+    any other lazy load raises instead of silently issuing a SELECT per row."""
+    return db.query(Automation).options(
+        selectinload(Automation.conditions),
+        selectinload(Automation.actions),
+        raiseload("*"),
+    )
 
 
-def _automation_to_response(auto: Automation) -> dict:
+def _automation_to_response(
+    auto: Automation,
+    conditions: list[dict] | None = None,
+    actions: list[dict] | None = None,
+) -> dict:
+    """Serialise an automation. ``conditions``/``actions`` take already-shaped
+    child rows so callers that just inserted them don't touch the relationships.
+
+    The relationships are declared with ``order_by=orden``, so the loader
+    (selectinload included) returns children already sorted.
+    """
+    if conditions is None:
+        conditions = [
+            {"id": c.id, "campo": c.campo, "operador": c.operador, "valor": c.valor, "orden": c.orden}
+            for c in auto.conditions
+        ]
+    if actions is None:
+        actions = [
+            {"id": a.id, "tipo": a.tipo, "config": a.config, "orden": a.orden}
+            for a in auto.actions
+        ]
     return {
         "id": auto.id,
         "cuenta_id": auto.cuenta_id,
@@ -68,14 +82,8 @@ def _automation_to_response(auto: Automation) -> dict:
         "trigger_tipo": auto.trigger_tipo,
         "trigger_config": auto.trigger_config,
         "activo": auto.activo,
-        "conditions": [
-            {"id": c.id, "campo": c.campo, "operador": c.operador, "valor": c.valor, "orden": c.orden}
-            for c in sorted(auto.conditions, key=lambda c: c.orden)
-        ],
-        "actions": [
-            {"id": a.id, "tipo": a.tipo, "config": a.config, "orden": a.orden}
-            for a in sorted(auto.actions, key=lambda a: a.orden)
-        ],
+        "conditions": conditions,
+        "actions": actions,
         "created_at": auto.created_at,
         "updated_at": auto.updated_at,
     }
@@ -94,15 +102,7 @@ def create_automation(
     body: AutomationCreate,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
-    _validate_trigger(body.trigger_tipo)
-    for c in body.conditions:
-        _validate_operator(c.operador)
-    for a in body.actions:
-        _validate_action_type(a.tipo)
+    assert_account_exists(db, account_id)
 
     auto = Automation(
         cuenta_id=account_id,
@@ -115,28 +115,30 @@ def create_automation(
     db.add(auto)
     db.flush()
 
-    for c in body.conditions:
-        db.add(AutomationCondition(
-            automation_id=auto.id,
-            campo=c.campo,
-            operador=c.operador,
-            valor=c.valor,
-            orden=c.orden,
-        ))
-
-    for a in body.actions:
-        db.add(AutomationAction(
-            automation_id=auto.id,
-            tipo=a.tipo,
-            config=a.config,
-            orden=a.orden,
-        ))
-
+    # Ids are generated here so each child table gets a single multi-row
+    # INSERT and the response is built without reading the rows back.
+    conditions = sorted(
+        ({"id": uuid.uuid4(), **c.model_dump()} for c in body.conditions),
+        key=lambda c: c["orden"],
+    )
+    actions = sorted(
+        ({"id": uuid.uuid4(), **a.model_dump()} for a in body.actions),
+        key=lambda a: a["orden"],
+    )
+    if conditions:
+        db.execute(
+            insert(AutomationCondition),
+            [{"automation_id": auto.id, **c} for c in conditions],
+        )
+    if actions:
+        db.execute(
+            insert(AutomationAction),
+            [{"automation_id": auto.id, **a} for a in actions],
+        )
     db.commit()
-    db.refresh(auto)
 
     logger.info("Automation '%s' created for account %s", auto.nombre, account_id)
-    return _automation_to_response(auto)
+    return _automation_to_response(auto, conditions=conditions, actions=actions)
 
 
 @router.get(
@@ -148,12 +150,10 @@ def list_automations(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     autos = (
-        db.query(Automation)
+        _automations_with_children(db)
         .filter(Automation.cuenta_id == account_id)
         .order_by(Automation.created_at.desc())
         .all()
@@ -170,7 +170,7 @@ def get_automation(
     automation_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
+    auto = _automations_with_children(db).filter(Automation.id == automation_id).first()
     if not auto:
         raise HTTPException(status_code=404, detail="Automation not found")
     return _automation_to_response(auto)
@@ -186,7 +186,7 @@ def update_automation(
     body: AutomationUpdate,
     db: Session = Depends(get_db),
 ) -> dict:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
+    auto = _automations_with_children(db).filter(Automation.id == automation_id).first()
     if not auto:
         raise HTTPException(status_code=404, detail="Automation not found")
 
@@ -195,15 +195,15 @@ def update_automation(
     if body.descripcion is not None:
         auto.descripcion = body.descripcion
     if body.trigger_tipo is not None:
-        _validate_trigger(body.trigger_tipo)
         auto.trigger_tipo = body.trigger_tipo
     if body.trigger_config is not None:
         auto.trigger_config = body.trigger_config
     if body.activo is not None:
         auto.activo = body.activo
 
+    # No refresh: it would expire the eager-loaded children (and hit raiseload);
+    # updated_at comes back through the UPDATE's RETURNING.
     db.commit()
-    db.refresh(auto)
     return _automation_to_response(auto)
 
 
@@ -216,12 +216,14 @@ def delete_automation(
     automation_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
-    if not auto:
+    # Conditions, actions and logs go with it through ON DELETE CASCADE
+    nombre = db.execute(
+        delete(Automation).where(Automation.id == automation_id).returning(Automation.nombre)
+    ).scalar_one_or_none()
+    if nombre is None:
         raise HTTPException(status_code=404, detail="Automation not found")
-    db.delete(auto)
     db.commit()
-    logger.info("Automation '%s' deleted", auto.nombre)
+    logger.info("Automation '%s' deleted", nombre)
 
 
 # ── Conditions CRUD ────────────────────────────────────────────────────────
@@ -237,11 +239,7 @@ def add_condition(
     body: ConditionCreate,
     db: Session = Depends(get_db),
 ) -> AutomationCondition:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
-    if not auto:
-        raise HTTPException(status_code=404, detail="Automation not found")
-
-    _validate_operator(body.operador)
+    _assert_automation_exists(db, automation_id)
 
     cond = AutomationCondition(
         automation_id=automation_id,
@@ -252,7 +250,6 @@ def add_condition(
     )
     db.add(cond)
     db.commit()
-    db.refresh(cond)
     return cond
 
 
@@ -265,10 +262,9 @@ def delete_condition(
     condition_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    cond = db.query(AutomationCondition).filter(AutomationCondition.id == condition_id).first()
-    if not cond:
+    result = db.execute(delete(AutomationCondition).where(AutomationCondition.id == condition_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Condition not found")
-    db.delete(cond)
     db.commit()
 
 
@@ -285,11 +281,7 @@ def add_action(
     body: ActionCreate,
     db: Session = Depends(get_db),
 ) -> AutomationAction:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
-    if not auto:
-        raise HTTPException(status_code=404, detail="Automation not found")
-
-    _validate_action_type(body.tipo)
+    _assert_automation_exists(db, automation_id)
 
     action = AutomationAction(
         automation_id=automation_id,
@@ -299,7 +291,6 @@ def add_action(
     )
     db.add(action)
     db.commit()
-    db.refresh(action)
     return action
 
 
@@ -312,10 +303,9 @@ def delete_action(
     action_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    action = db.query(AutomationAction).filter(AutomationAction.id == action_id).first()
-    if not action:
+    result = db.execute(delete(AutomationAction).where(AutomationAction.id == action_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Action not found")
-    db.delete(action)
     db.commit()
 
 
@@ -328,23 +318,25 @@ def delete_action(
 )
 def list_automation_logs(
     automation_id: uuid.UUID,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
-    if not auto:
-        raise HTTPException(status_code=404, detail="Automation not found")
+    _assert_automation_exists(db, automation_id)
 
     query = db.query(AutomationLog).filter(AutomationLog.automation_id == automation_id)
-    total = query.count()
+    if cursor:
+        query = query.filter(tuple_(AutomationLog.created_at, AutomationLog.id) < decode_cursor(cursor))
     items = (
-        query.order_by(AutomationLog.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+        query.order_by(AutomationLog.created_at.desc(), AutomationLog.id.desc())
+        .limit(limit + 1)
         .all()
     )
-    return {"items": items, "total": total}
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 # ── Toggle ─────────────────────────────────────────────────────────────────
@@ -358,25 +350,29 @@ def toggle_automation(
     automation_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    auto = db.query(Automation).filter(Automation.id == automation_id).first()
+    auto = _automations_with_children(db).filter(Automation.id == automation_id).first()
     if not auto:
         raise HTTPException(status_code=404, detail="Automation not found")
     auto.activo = not auto.activo
     db.commit()
-    db.refresh(auto)
     return _automation_to_response(auto)
 
 
 # ── Meta ───────────────────────────────────────────────────────────────────
 
+# Built once: the lists are module constants and only change on deploy.
+_AUTOMATION_META = {
+    "trigger_types": TRIGGER_TYPES,
+    "action_types": ACTION_TYPES,
+    "condition_operators": CONDITION_OPERATORS,
+}
+
+
 @router.get(
     "/automation-meta",
     response_model=AutomationMetaResponse,
     summary="List trigger types, action types, and condition operators",
 )
-def automation_meta() -> dict:
-    return {
-        "trigger_types": TRIGGER_TYPES,
-        "action_types": ACTION_TYPES,
-        "condition_operators": CONDITION_OPERATORS,
-    }
+def automation_meta(response: Response) -> dict:
+    response.headers["Cache-Control"] = "private, max-age=86400"
+    return _AUTOMATION_META
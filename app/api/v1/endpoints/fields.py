@@ -1,24 +1,20 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, tuple_
 from sqlalchemy.orm import Session
 
+from app.core.caching import field_names_cache
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.field import CustomField
 from app.schemas.field import FieldCreate, FieldListResponse, FieldResponse, FieldUpdate
+from app.services.account_lookup import assert_account_exists
 
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
 
-def _get_account_or_404(db: Session, account_id: uuid.UUID) -> Account:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-    return account
-
-
 @router.get(
     "/accounts/{account_id}/fields",
     response_model=FieldListResponse,
@@ -26,20 +22,24 @@ def _get_account_or_404(db: Session, account_id: uuid.UUID) -> Account:
 )
 def list_fields(
     account_id: uuid.UUID,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
 ) -> dict:
-    _get_account_or_404(db, account_id)
+    assert_account_exists(db, account_id)
     query = db.query(CustomField).filter(CustomField.cuenta_id == account_id)
-    total = query.count()
+    if cursor:
+        query = query.filter(tuple_(CustomField.created_at, CustomField.id) < decode_cursor(cursor))
     items = (
-        query.order_by(CustomField.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+        query.order_by(CustomField.created_at.desc(), CustomField.id.desc())
+        .limit(limit + 1)
         .all()
     )
-    return {"items": items, "total": total}
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.post(
@@ -53,7 +53,7 @@ def create_field(
     data: FieldCreate,
     db: Session = Depends(get_db),
 ) -> CustomField:
-    _get_account_or_404(db, account_id)
+    assert_account_exists(db, account_id)
 
     exists = (
         db.query(CustomField)
@@ -72,7 +72,7 @@ def create_field(
     field = CustomField(cuenta_id=account_id, **data.model_dump())
     db.add(field)
     db.commit()
-    db.refresh(field)
+    field_names_cache.pop(account_id)
     return field
 
 
@@ -94,7 +94,7 @@ def update_field(
     for key, value in update_data.items():
         setattr(field, key, value)
     db.commit()
-    db.refresh(field)
+    field_names_cache.pop(field.cuenta_id)
     return field
 
 
@@ -107,8 +107,10 @@ def delete_field(
     field_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    field = db.query(CustomField).filter(CustomField.id == field_id).first()
-    if not field:
+    cuenta_id = db.execute(
+        delete(CustomField).where(CustomField.id == field_id).returning(CustomField.cuenta_id)
+    ).scalar_one_or_none()
+    if cuenta_id is None:
         raise HTTPException(status_code=404, detail="Field not found")
-    db.delete(field)
     db.commit()
+    field_names_cache.pop(cuenta_id)
@@ -1,17 +1,23 @@
 import logging
-from typing import Any
+import uuid
+from typing import Any, NamedTuple
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.caching import api_key_cache
+from app.core.database import SessionLocal, get_db
 from app.models.account import Account
-from app.models.field import CustomField
 from app.models.lead import Lead
 from app.models.record import Record
 from app.schemas.ingest import IngestResponse
 from app.services.automation_engine import run_automations
-from app.services.field_auto_creator import auto_create_fields, detect_unknown_fields
+from app.services.field_auto_creator import (
+    auto_create_fields,
+    detect_unknown_fields,
+    get_account_field_names,
+)
 from app.services.lead_id_generator import next_id_lead
 from app.services.routing_engine import evaluate_routing
 from app.services.webhook_dispatcher import dispatch_event
@@ -20,6 +26,61 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+class _IngestAccount(NamedTuple):
+    id: uuid.UUID
+    nombre: str
+    auto_crear_campos: bool
+
+
+def _resolve_account(db: Session, api_key: str) -> _IngestAccount | None:
+    """Active account for an ingest API key, served from a short TTL cache.
+
+    Only active accounts are cached; account writes pop the key, so a
+    deactivated account stops ingesting immediately on this worker and
+    within the TTL on the others.
+    """
+    account = api_key_cache.get(api_key)
+    if account is None:
+        row = (
+            db.query(Account.id, Account.nombre, Account.auto_crear_campos)
+            .filter(Account.api_key == api_key, Account.activo.is_(True))
+            .first()
+        )
+        if row is None:
+            return None
+        account = _IngestAccount(*row)
+        api_key_cache.set(api_key, account)
+    return account
+
+
+def _fire_lead_created(
+    cuenta_id: uuid.UUID,
+    lead_id: uuid.UUID,
+    record_id: uuid.UUID,
+    payload: dict[str, Any],
+) -> None:
+    """Post-response side effects of an ingest, on a session of their own
+    (the request session is closed by the time background tasks run)."""
+    db = SessionLocal()
+    try:
+        # Fire webhooks (best-effort, independent of automations)
+        try:
+            event_payload = {"lead_id": str(lead_id), "record_id": str(record_id), "datos": payload}
+            dispatch_event(db, cuenta_id, "lead_created", event_payload)
+        except Exception as e:
+            logger.error("Webhook dispatch failed for account %s: %s", cuenta_id, e)
+            db.rollback()
+
+        # Fire automations (best-effort, independent of webhooks)
+        try:
+            lead = db.get(Lead, lead_id)
+            run_automations(db, cuenta_id, "lead_created", lead=lead)
+        except Exception as e:
+            logger.error("Automations failed for account %s: %s", cuenta_id, e)
+    finally:
+        db.close()
+
+
 @router.post(
     "/ingest/{account_api_key}",
     response_model=IngestResponse,
@@ -30,13 +91,10 @@ def ingest_webhook(
     account_api_key: str,
     payload: dict[str, Any],
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> IngestResponse:
-    account = (
-        db.query(Account)
-        .filter(Account.api_key == account_api_key, Account.activo.is_(True))
-        .first()
-    )
+    account = _resolve_account(db, account_api_key)
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -45,12 +103,7 @@ def ingest_webhook(
 
     logger.info("Webhook received for account '%s' (%s)", account.nombre, account.id)
 
-    existing_fields = (
-        db.query(CustomField.nombre_campo)
-        .filter(CustomField.cuenta_id == account.id)
-        .all()
-    )
-    existing_names: set[str] = {f[0] for f in existing_fields}
+    existing_names = get_account_field_names(db, account.id)
 
     fields_created: list[str] = []
     unknown_fields: list[str] = []
@@ -64,16 +117,19 @@ def ingest_webhook(
                 "Unknown fields for account %s: %s", account.id, unknown_fields
             )
 
-    record = Record(
-        cuenta_id=account.id,
-        datos=payload,
-        metadata_={
-            "source_ip": request.client.host if request.client else None,
-            "unknown_fields": unknown_fields or None,
-        },
-    )
-    db.add(record)
-    db.flush()
+    # INSERT ... RETURNING id: write-only rows, nothing to refresh or track
+    record_id = db.execute(
+        insert(Record)
+        .values(
+            cuenta_id=account.id,
+            datos=payload,
+            metadata_={
+                "source_ip": request.client.host if request.client else None,
+                "unknown_fields": unknown_fields or None,
+            },
+        )
+        .returning(Record.id)
+    ).scalar_one()
 
     try:
         lead_base_id = evaluate_routing(db, account.id, payload)
@@ -82,37 +138,30 @@ def ingest_webhook(
         logger.error("Routing failed for account %s: %s", account.id, e)
         lead_base_id = None
 
-    lead = Lead(
-        cuenta_id=account.id,
-        record_id=record.id,
-        datos=payload,
-        lead_base_id=lead_base_id,
-        id_lead=next_id_lead(db, account.id),
-    )
-    db.add(lead)
+    lead_id = db.execute(
+        insert(Lead)
+        .values(
+            cuenta_id=account.id,
+            record_id=record_id,
+            datos=payload,
+            lead_base_id=lead_base_id,
+            id_lead=next_id_lead(db, account.id),
+        )
+        .returning(Lead.id)
+    ).scalar_one()
     db.commit()
-    db.refresh(record)
-    db.refresh(lead)
 
-    logger.info("Record %s and Lead %s created (base=%s) for account %s", record.id, lead.id, lead_base_id, account.id)
+    logger.info("Record %s and Lead %s created (base=%s) for account %s", record_id, lead_id, lead_base_id, account.id)
 
-    # Fire webhooks (best-effort, independent of automations)
-    try:
-        event_payload = {"lead_id": str(lead.id), "record_id": str(record.id), "datos": payload}
-        dispatch_event(db, account.id, "lead_created", event_payload)
-    except Exception as e:
-        logger.error("Webhook dispatch failed for account %s: %s", account.id, e)
-
-    # Fire automations (best-effort, independent of webhooks)
-    try:
-        run_automations(db, account.id, "lead_created", lead=lead)
-    except Exception as e:
-        logger.error("Automations failed for account %s: %s", account.id, e)
+    # Webhooks and automations run after the response is sent
+    background_tasks.add_task(
+        _fire_lead_created, account.id, lead_id, record_id, payload,
+    )
 
     return IngestResponse(
         success=True,
-        record_id=record.id,
-        lead_id=lead.id,
+        record_id=record_id,
+        lead_id=lead_id,
         lead_base_id=lead_base_id,
         unknown_fields=unknown_fields,
         auto_create_enabled=account.auto_crear_campos,
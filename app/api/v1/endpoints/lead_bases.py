@@ -1,13 +1,15 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
-from sqlalchemy import func
+from sqlalchemy import any_, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, raiseload
 
+from app.core.caching import lead_counts_cache
 from app.core.database import get_db
+from app.core.pagination import page_with_total
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.lead import Lead
 from app.models.lead_base import LeadBase
 from app.models.routing_rule import RoutingRule
@@ -24,6 +26,7 @@ from app.schemas.lead_base import (
     RoutingRuleResponse,
     RoutingRuleUpdate,
 )
+from app.services.account_lookup import assert_account_exists
 
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
@@ -31,6 +34,23 @@ router = APIRouter(dependencies=[Depends(verify_admin_key)])
 # --- Lead Bases ---
 
 
+def _unset_default(db: Session, cuenta_id: uuid.UUID) -> None:
+    """Clear the account's current default. Runs before the new default is
+    flushed so uq_lead_bases_default_per_account never sees two at once."""
+    db.query(LeadBase).filter(
+        LeadBase.cuenta_id == cuenta_id, LeadBase.es_default.is_(True)
+    ).update({"es_default": False})
+
+
+def _commit_default_change(db: Session) -> None:
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request set a default for the same account in the meantime
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Default base changed concurrently, retry")
+
+
 @router.post(
     "/accounts/{account_id}/bases",
     response_model=LeadBaseResponse,
@@ -42,20 +62,16 @@ def create_lead_base(
     body: LeadBaseCreate,
     db: Session = Depends(get_db),
 ) -> LeadBase:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     # If this is the first base for the account, make it default
-    existing_count = db.query(LeadBase).filter(LeadBase.cuenta_id == account_id).count()
-    if existing_count == 0:
-        body.es_default = True
+    if not body.es_default:
+        has_bases = db.query(LeadBase.id).filter(LeadBase.cuenta_id == account_id).first()
+        body.es_default = has_bases is None
 
     # If marking as default, unset previous default
     if body.es_default:
-        db.query(LeadBase).filter(
-            LeadBase.cuenta_id == account_id, LeadBase.es_default.is_(True)
-        ).update({"es_default": False})
+        _unset_default(db, account_id)
 
     lead_base = LeadBase(
         cuenta_id=account_id,
@@ -63,8 +79,7 @@ def create_lead_base(
         es_default=body.es_default,
     )
     db.add(lead_base)
-    db.commit()
-    db.refresh(lead_base)
+    _commit_default_change(db)
     return lead_base
 
 
@@ -77,9 +92,7 @@ def list_lead_bases(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     bases = (
         db.query(LeadBase)
@@ -88,13 +101,16 @@ def list_lead_bases(
         .all()
     )
 
-    # Count leads per base
-    lead_counts = dict(
-        db.query(Lead.lead_base_id, func.count(Lead.id))
-        .filter(Lead.lead_base_id.in_([b.id for b in bases]))
-        .group_by(Lead.lead_base_id)
-        .all()
-    )
+    # Count leads per base (GROUP BY over the account's leads, cached briefly)
+    lead_counts = lead_counts_cache.get(account_id)
+    if lead_counts is None:
+        lead_counts = dict(
+            db.query(Lead.lead_base_id, func.count(Lead.id))
+            .filter(Lead.lead_base_id.in_([b.id for b in bases]))
+            .group_by(Lead.lead_base_id)
+            .all()
+        )
+        lead_counts_cache.set(account_id, lead_counts)
 
     items = []
     for base in bases:
@@ -119,7 +135,7 @@ def get_lead_base(
     base_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> LeadBase:
-    base = db.query(LeadBase).filter(LeadBase.id == base_id).first()
+    base = db.get(LeadBase, base_id)
     if not base:
         raise HTTPException(status_code=404, detail="Lead base not found")
     return base
@@ -135,21 +151,18 @@ def update_lead_base(
     body: LeadBaseUpdate,
     db: Session = Depends(get_db),
 ) -> LeadBase:
-    base = db.query(LeadBase).filter(LeadBase.id == base_id).first()
+    base = db.get(LeadBase, base_id)
     if not base:
         raise HTTPException(status_code=404, detail="Lead base not found")
 
     if body.nombre is not None:
         base.nombre = body.nombre
 
-    if body.es_default is True:
-        db.query(LeadBase).filter(
-            LeadBase.cuenta_id == base.cuenta_id, LeadBase.es_default.is_(True)
-        ).update({"es_default": False})
+    if body.es_default is True and not base.es_default:
+        _unset_default(db, base.cuenta_id)
         base.es_default = True
 
-    db.commit()
-    db.refresh(base)
+    _commit_default_change(db)
     return base
 
 
@@ -162,7 +175,7 @@ def delete_lead_base(
     base_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    base = db.query(LeadBase).filter(LeadBase.id == base_id).first()
+    base = db.get(LeadBase, base_id)
     if not base:
         raise HTTPException(status_code=404, detail="Lead base not found")
     if base.es_default:
@@ -170,6 +183,7 @@ def delete_lead_base(
 
     db.delete(base)
     db.commit()
+    lead_counts_cache.pop(base.cuenta_id)
 
 
 # --- Routing Rules ---
@@ -186,17 +200,10 @@ def create_routing_rule(
     body: RoutingRuleCreate,
     db: Session = Depends(get_db),
 ) -> RoutingRule:
-    base = db.query(LeadBase).filter(LeadBase.id == base_id).first()
+    base = db.get(LeadBase, base_id)
     if not base:
         raise HTTPException(status_code=404, detail="Lead base not found")
 
-    valid_operators = {"equals", "not_equals", "contains", "greater_than", "less_than"}
-    if body.operador not in valid_operators:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid operator. Must be one of: {', '.join(sorted(valid_operators))}",
-        )
-
     rule = RoutingRule(
         lead_base_id=base_id,
         campo=body.campo,
@@ -205,8 +212,8 @@ def create_routing_rule(
         prioridad=body.prioridad,
     )
     db.add(rule)
+    # id and created_at come back through the INSERT's RETURNING (eager_defaults)
     db.commit()
-    db.refresh(rule)
     return rule
 
 
@@ -219,7 +226,7 @@ def list_routing_rules(
     base_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    base = db.query(LeadBase).filter(LeadBase.id == base_id).first()
+    base = db.get(LeadBase, base_id)
     if not base:
         raise HTTPException(status_code=404, detail="Lead base not found")
 
@@ -241,28 +248,19 @@ def update_routing_rule(
     rule_id: uuid.UUID,
     body: RoutingRuleUpdate,
     db: Session = Depends(get_db),
-) -> RoutingRule:
-    rule = db.query(RoutingRule).filter(RoutingRule.id == rule_id).first()
-    if not rule:
+) -> RoutingRuleResponse:
+    # UPDATE ... RETURNING: lookup, write and read-back in one round-trip
+    table = RoutingRule.__table__
+    values = body.model_dump(exclude_none=True)
+    if values:
+        stmt = update(table).where(table.c.id == rule_id).values(**values).returning(table)
+    else:
+        stmt = select(table).where(table.c.id == rule_id)
+    row = db.execute(stmt).mappings().first()
+    if not row:
         raise HTTPException(status_code=404, detail="Routing rule not found")
-
-    if body.campo is not None:
-        rule.campo = body.campo
-    if body.operador is not None:
-        valid_operators = {"equals", "not_equals", "contains", "greater_than", "less_than"}
-        if body.operador not in valid_operators:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid operator. Must be one of: {', '.join(sorted(valid_operators))}",
-            )
-        rule.operador = body.operador
-    if body.valor is not None:
-        rule.valor = body.valor
-    if body.prioridad is not None:
-        rule.prioridad = body.prioridad
-
+    rule = RoutingRuleResponse.model_validate(row)
     db.commit()
-    db.refresh(rule)
     return rule
 
 
@@ -275,11 +273,9 @@ def delete_routing_rule(
     rule_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> None:
-    rule = db.query(RoutingRule).filter(RoutingRule.id == rule_id).first()
-    if not rule:
+    result = db.execute(delete(RoutingRule).where(RoutingRule.id == rule_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Routing rule not found")
-
-    db.delete(rule)
     db.commit()
 
 
@@ -298,20 +294,20 @@ def list_leads_by_base(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    base = db.query(LeadBase).filter(
+    base_nombre = db.query(LeadBase.nombre).filter(
         LeadBase.id == base_id, LeadBase.cuenta_id == account_id
-    ).first()
-    if not base:
+    ).scalar()
+    if base_nombre is None:
         raise HTTPException(status_code=404, detail="Lead base not found")
 
-    query = db.query(Lead).filter(Lead.lead_base_id == base_id)
-    total = query.count()
-    leads = (
-        query.order_by(Lead.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    query = db.query(Lead).options(
+        load_only(
+            Lead.id, Lead.id_lead, Lead.cuenta_id, Lead.record_id,
+            Lead.lead_base_id, Lead.datos, Lead.created_at,
+        ),
+        raiseload("*"),
+    ).filter(Lead.lead_base_id == base_id)
+    leads, total = page_with_total(query.order_by(Lead.created_at.desc()), page, page_size)
 
     items = []
     for lead in leads:
@@ -321,7 +317,7 @@ def list_leads_by_base(
             "cuenta_id": lead.cuenta_id,
             "record_id": lead.record_id,
             "lead_base_id": lead.lead_base_id,
-            "base_nombre": base.nombre,
+            "base_nombre": base_nombre,
             "datos": lead.datos,
             "created_at": lead.created_at,
         })
@@ -345,11 +341,18 @@ def move_leads(
     if not target_base:
         raise HTTPException(status_code=404, detail="Target base not found")
 
+    # No session sync: nothing reads these leads back through the ORM here,
+    # so the UPDATE runs without a preliminary SELECT of the matching ids.
     moved = (
         db.query(Lead)
-        .filter(Lead.id.in_(body.lead_ids), Lead.cuenta_id == target_base.cuenta_id)
-        .update({"lead_base_id": target_base.id}, synchronize_session="fetch")
+        .filter(
+            # One uuid[] parameter instead of IN ($1, ..., $N): same SQL text for any N
+            Lead.id == any_(bindparam("lead_ids", body.lead_ids, type_=ARRAY(UUID(as_uuid=True)))),
+            Lead.cuenta_id == target_base.cuenta_id,
+        )
+        .update({"lead_base_id": target_base.id}, synchronize_session=False)
     )
     db.commit()
+    lead_counts_cache.pop(target_base.cuenta_id)
 
     return {"moved": moved}
@@ -1,34 +1,89 @@
 import io
 import logging
 import uuid
+from itertools import chain
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from openpyxl import Workbook, load_workbook
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, any_, bindparam, column, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import Query as ORMQuery
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload
 
+from app.core.caching import update_template_cache
 from app.core.database import get_db
+from app.core.pagination import page_with_total
 from app.core.security import verify_admin_key
 from app.models.account import Account
+from app.models.field import CustomField
 from app.models.lead import Lead
 from app.models.lead_base import LeadBase
 from app.models.lote import Lote
+from app.models.record import Record
 from app.schemas.lead import BulkUpdateResponse, LeadListResponse, LeadResponse
+from app.services.account_lookup import assert_account_exists
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
+_UPDATE_BATCH = 1000  # rows per UPDATE ... FROM (VALUES ...) statement
 
-def _lead_to_dict(lead: Lead, base_nombre: str | None = None, lote_nombre: str | None = None) -> dict:
+
+# Only the columns _lead_to_dict reads, plus the base and lote names joined
+# into the same SELECT; any other relationship access raises instead of
+# lazy-loading per row.
+_LEAD_LOAD_OPTIONS = (
+    load_only(
+        Lead.id, Lead.id_lead, Lead.cuenta_id, Lead.record_id,
+        Lead.lead_base_id, Lead.lote_id, Lead.datos, Lead.created_at,
+    ),
+    joinedload(Lead.lead_base).load_only(LeadBase.nombre),
+    joinedload(Lead.lote).load_only(Lote.nombre),
+    raiseload("*"),
+)
+
+
+def _leads_with_names(db: Session) -> ORMQuery:
+    return db.query(Lead).options(*_LEAD_LOAD_OPTIONS)
+
+
+def _update_lead_datos(db: Session, rows: list[tuple[uuid.UUID, dict]]) -> None:
+    """UPDATE leads SET datos = v.datos FROM (VALUES ...) AS v(id, datos) WHERE leads.id = v.id"""
+    v = values(
+        column("id", UUID(as_uuid=True)), column("datos", JSONB), name="v",
+    ).data(rows)
+    db.execute(
+        update(Lead).where(Lead.id == v.c.id).values(datos=v.c.datos),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _mirror_datos_to_records(db: Session, lead_ids: list[uuid.UUID]) -> None:
+    """UPDATE records SET datos = leads.datos FROM leads
+    WHERE records.id = leads.record_id AND leads.id = ANY(:lead_ids)"""
+    db.execute(
+        update(Record)
+        .where(
+            Record.id == Lead.record_id,
+            Lead.id == any_(bindparam("lead_ids", lead_ids, type_=ARRAY(UUID(as_uuid=True)))),
+        )
+        .values(datos=Lead.datos),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _lead_to_dict(lead: Lead) -> dict:
     return {
         "id": lead.id,
         "id_lead": lead.id_lead,
         "cuenta_id": lead.cuenta_id,
         "record_id": lead.record_id,
         "lead_base_id": lead.lead_base_id,
-        "base_nombre": base_nombre,
+        "base_nombre": lead.lead_base.nombre if lead.lead_base else None,
         "lote_id": lead.lote_id,
-        "lote_nombre": lote_nombre,
+        "lote_nombre": lead.lote.nombre if lead.lote else None,
         "datos": lead.datos,
         "created_at": lead.created_at,
     }
@@ -45,41 +100,11 @@ def list_leads(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
-    query = db.query(Lead).filter(Lead.cuenta_id == account_id)
-    total = query.count()
-    leads = (
-        query.order_by(Lead.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    assert_account_exists(db, account_id)
 
-    # Fetch base names
-    base_ids = {l.lead_base_id for l in leads if l.lead_base_id}
-    base_names: dict[uuid.UUID, str] = {}
-    if base_ids:
-        bases = db.query(LeadBase.id, LeadBase.nombre).filter(LeadBase.id.in_(base_ids)).all()
-        base_names = {b.id: b.nombre for b in bases}
-
-    # Fetch lote names
-    lote_ids = {l.lote_id for l in leads if l.lote_id}
-    lote_names: dict[uuid.UUID, str] = {}
-    if lote_ids:
-        lotes = db.query(Lote.id, Lote.nombre).filter(Lote.id.in_(lote_ids)).all()
-        lote_names = {lo.id: lo.nombre for lo in lotes}
-
-    items = [
-        _lead_to_dict(
-            lead,
-            base_names.get(lead.lead_base_id) if lead.lead_base_id else None,
-            lote_names.get(lead.lote_id) if lead.lote_id else None,
-        )
-        for lead in leads
-    ]
+    query = _leads_with_names(db).filter(Lead.cuenta_id == account_id)
+    leads, total = page_with_total(query.order_by(Lead.created_at.desc()), page, page_size)
+    items = [_lead_to_dict(lead) for lead in leads]
 
     return {"items": items, "total": total, "page": page, "page_size": page_size}
 
@@ -93,23 +118,10 @@ def get_lead(
     lead_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    lead = db.get(Lead, lead_id, options=_LEAD_LOAD_OPTIONS)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
-
-    base_nombre = None
-    if lead.lead_base_id:
-        base = db.query(LeadBase.nombre).filter(LeadBase.id == lead.lead_base_id).first()
-        if base:
-            base_nombre = base.nombre
-
-    lote_nombre = None
-    if lead.lote_id:
-        lote = db.query(Lote.nombre).filter(Lote.id == lead.lote_id).first()
-        if lote:
-            lote_nombre = lote.nombre
-
-    return _lead_to_dict(lead, base_nombre, lote_nombre)
+    return _lead_to_dict(lead)
 
 
 # ---------------------------------------------------------------------------
@@ -123,32 +135,35 @@ def download_update_template(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> StreamingResponse:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    account_nombre = db.query(Account.nombre).filter(Account.id == account_id).scalar()
+    if account_nombre is None:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    from app.models.field import CustomField
-
     fields = (
         db.query(CustomField.nombre_campo)
         .filter(CustomField.cuenta_id == account_id)
         .order_by(CustomField.created_at)
         .all()
     )
-    field_names = [f[0] for f in fields]
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Actualizar Leads"
-    ws.append(["id_lead"] + field_names)
-
-    buf = io.BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-
-    filename = f"actualizar_leads_{account.nombre}.xlsx"
+    field_names = tuple(f[0] for f in fields)
+
+    cache_key = (account_id, field_names)
+    content = update_template_cache.get(cache_key)
+    if content is None:
+        # write_only streams rows straight into the zip instead of building
+        # a Cell object per column
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Actualizar Leads")
+        ws.append(["id_lead", *field_names])
+
+        buf = io.BytesIO()
+        wb.save(buf)
+        content = buf.getvalue()
+        update_template_cache.set(cache_key, content)
+
+    filename = f"actualizar_leads_{account_nombre}.xlsx"
     return StreamingResponse(
-        buf,
+        io.BytesIO(content),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -162,81 +177,109 @@ def download_update_template(
     response_model=BulkUpdateResponse,
     summary="Bulk update leads from Excel file",
 )
-def bulk_update_leads(
+async def bulk_update_leads(
     account_id: uuid.UUID,
     file: UploadFile,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    # The upload is read on the event loop; parsing and SQL run in the
+    # threadpool so neither blocks it.
+    content = await file.read()
+    return await run_in_threadpool(_apply_bulk_update, db, account_id, content)
+
+
+def _apply_bulk_update(db: Session, account_id: uuid.UUID, content: bytes) -> dict:
+    assert_account_exists(db, account_id)
 
     try:
-        content = file.file.read()
-        wb = load_workbook(filename=io.BytesIO(content), read_only=True)
+        wb = load_workbook(filename=io.BytesIO(content), read_only=True, data_only=True)
         ws = wb.active
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid Excel file")
 
-    rows = list(ws.iter_rows(values_only=True))
-    if len(rows) < 2:
-        raise HTTPException(status_code=400, detail="Excel must have a header row and at least one data row")
-
-    header = [str(c).strip() if c is not None else "" for c in rows[0]]
-
-    # First column MUST be id_lead
-    if not header or header[0].lower() != "id_lead":
-        raise HTTPException(
-            status_code=400,
-            detail="First column must be 'id_lead'",
-        )
-
-    update_columns = header[1:]
-    if not update_columns:
-        raise HTTPException(status_code=400, detail="No data columns to update (only id_lead found)")
-
     updated = 0
     not_found_ids: list[int] = []
     errors: list[str] = []
 
-    for row_idx, row in enumerate(rows[1:], start=2):
-        raw_id = row[0] if row else None
-        if raw_id is None or str(raw_id).strip() == "":
-            continue
-
-        try:
-            lead_id_val = int(raw_id)
-        except (ValueError, TypeError):
-            errors.append(f"Row {row_idx}: invalid id_lead '{raw_id}'")
-            continue
-
-        lead = db.query(Lead).filter(
-            Lead.cuenta_id == account_id,
-            Lead.id_lead == lead_id_val,
-        ).first()
+    # Parse every id_lead first so the leads can be fetched in one query.
+    # Rows are streamed from the read-only sheet, never listed as a whole.
+    parsed: list[tuple[int, tuple]] = []
+    try:
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        first_row = next(rows, None)
+        if header_row is None or first_row is None:
+            raise HTTPException(status_code=400, detail="Excel must have a header row and at least one data row")
+
+        header = [str(c).strip() if c is not None else "" for c in header_row]
+
+        # First column MUST be id_lead
+        if not header or header[0].lower() != "id_lead":
+            raise HTTPException(
+                status_code=400,
+                detail="First column must be 'id_lead'",
+            )
+
+        update_columns = header[1:]
+        if not update_columns:
+            raise HTTPException(status_code=400, detail="No data columns to update (only id_lead found)")
+
+        for row_idx, row in enumerate(chain((first_row,), rows), start=2):
+            raw_id = row[0] if row else None
+            if raw_id is None or str(raw_id).strip() == "":
+                continue
 
+            try:
+                parsed.append((int(raw_id), row))
+            except (ValueError, TypeError):
+                errors.append(f"Row {row_idx}: invalid id_lead '{raw_id}'")
+    finally:
+        wb.close()
+
+    leads_by_id: dict[int, Row] = {}
+    if parsed:
+        leads_by_id = {
+            lead.id_lead: lead
+            for lead in db.query(Lead.id, Lead.id_lead, Lead.datos).filter(
+                Lead.cuenta_id == account_id,
+                Lead.id_lead == any_(bindparam(
+                    "id_leads",
+                    list({lead_id_val for lead_id_val, _ in parsed}),
+                    type_=ARRAY(Lead.id_lead.type),
+                )),
+            )
+        }
+
+    # (row index, field name) pairs resolved once rather than per row
+    named_columns = [(col_idx, col_name) for col_idx, col_name in enumerate(update_columns, start=1) if col_name]
+
+    # lead id -> merged datos; a repeated id_lead keeps merging
+    changes: dict[uuid.UUID, dict] = {}
+    for lead_id_val, row in parsed:
+        lead = leads_by_id.get(lead_id_val)
         if not lead:
             not_found_ids.append(lead_id_val)
             continue
 
-        # Build update dict from non-empty cells
-        new_datos = dict(lead.datos)
-        changed = False
-        for col_idx, col_name in enumerate(update_columns):
-            if not col_name:
-                continue
-            cell_val = row[col_idx + 1] if col_idx + 1 < len(row) else None
+        # Only the non-empty cells; datos is copied once, and only if changed
+        diff = {}
+        for col_idx, col_name in named_columns:
+            cell_val = row[col_idx] if col_idx < len(row) else None
             if cell_val is not None and str(cell_val).strip() != "":
-                new_datos[col_name] = cell_val
-                changed = True
-
-        if changed:
-            lead.datos = new_datos
-            # Also update the record
-            if lead.record:
-                lead.record.datos = new_datos
+                diff[col_name] = cell_val
+
+        if diff:
+            changes[lead.id] = {**changes.get(lead.id, lead.datos), **diff}
             updated += 1
 
+    # Set-based write: one UPDATE ... FROM (VALUES ...) per batch for leads,
+    # then the records copy datos from their lead server-side in one UPDATE
+    # rather than shipping every payload a second time.
+    items = list(changes.items())
+    for start in range(0, len(items), _UPDATE_BATCH):
+        _update_lead_datos(db, items[start:start + _UPDATE_BATCH])
+    if changes:
+        _mirror_datos_to_records(db, list(changes))
     db.commit()
 
     logger.info(
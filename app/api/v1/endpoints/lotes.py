@@ -1,19 +1,28 @@
+import csv
 import io
+import json
 import logging
 import uuid
+from collections.abc import Iterator
+from itertools import chain
 
-from fastapi import APIRouter, Depends, Form, HTTPException, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Query, UploadFile, status
 from fastapi.responses import StreamingResponse
-from openpyxl import Workbook, load_workbook
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
+from openpyxl import Workbook
+from python_calamine import CalamineWorkbook
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Query as ORMQuery
+from sqlalchemy.orm import Session, joinedload, raiseload
+
+from app.core.caching import lead_counts_cache
+from app.core.database import SessionLocal, get_db
+from app.core.ids import uuid7
 from app.core.security import verify_admin_key
 from app.models.account import Account
 from app.models.field import CustomField
 from app.models.lead import Lead
 from app.models.lead_base import LeadBase
-from app.models.lote import Lote
+from app.models.lote import Lote, LoteStatus
 from app.models.record import Record
 from app.schemas.lead import LeadListResponse
 from app.schemas.lote import (
@@ -22,12 +31,114 @@ from app.schemas.lote import (
     LoteListResponse,
     LoteResponse,
 )
-from app.services.field_auto_creator import auto_create_fields
-from app.services.lead_id_generator import next_id_lead
+from app.services.account_lookup import assert_account_exists
+from app.services.field_auto_creator import auto_create_fields, get_account_field_names
+from app.services.lead_id_generator import reserve_id_leads
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
+_IMPORT_BATCH = 5000  # rows buffered per write during lote import
+_COPY_MIN_ROWS = 1000  # below this a multi-row INSERT beats COPY's setup cost
+
+
+def _lotes_with_base_name(db: Session) -> ORMQuery:
+    """Lote query that brings the base name in the same SELECT; any other
+    relationship access raises instead of lazy-loading per row."""
+    return db.query(Lote).options(
+        joinedload(Lote.lead_base).load_only(LeadBase.nombre),
+        raiseload("*"),
+    )
+
+
+def _lote_to_dict(lote: Lote) -> dict:
+    return {
+        "id": lote.id,
+        "cuenta_id": lote.cuenta_id,
+        "nombre": lote.nombre,
+        "lead_base_id": lote.lead_base_id,
+        "base_nombre": lote.lead_base.nombre if lote.lead_base else None,
+        "total_leads": lote.total_leads,
+        "estado": lote.estado,
+        "created_at": lote.created_at,
+    }
+
+
+def _copy_rows(db: Session, table: str, columns: tuple[str, ...], rows: list[tuple]) -> None:
+    """COPY rows into ``table`` over the session's own connection (and so
+    inside its transaction), encoded as CSV so JSON text needs no escaping."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf,
+        )
+
+
+def _reserve_id_block(cuenta_id: uuid.UUID, count: int) -> int:
+    """Reserve ``count`` id_leads on a short session of its own that commits
+    right away, so the account's lead_counters row is not locked (stalling
+    /ingest) for the whole import. A failed import leaves a gap in the ids."""
+    db = SessionLocal()
+    try:
+        first_id_lead = reserve_id_leads(db, cuenta_id, count)
+        db.commit()
+        return first_id_lead
+    finally:
+        db.close()
+
+
+def _insert_lote_leads(
+    db: Session, cuenta_id: uuid.UUID, lote_id: uuid.UUID, rows: list[dict],
+) -> None:
+    """Insert a record and a lead per ``datos`` dict. Record ids and a block
+    of id_leads are assigned up front, so each table takes a single INSERT
+    (or COPY, for large batches)."""
+    first_id_lead = _reserve_id_block(cuenta_id, len(rows))
+    metadata = {"source": "lote_import", "lote_id": str(lote_id)}
+    record_ids = [uuid7() for _ in rows]
+
+    if len(rows) >= _COPY_MIN_ROWS:
+        metadata_json = json.dumps(metadata)
+        datos_json = [json.dumps(datos) for datos in rows]
+        _copy_rows(
+            db, "records", ("id", "cuenta_id", "datos", "metadata"),
+            [
+                (record_id, cuenta_id, datos, metadata_json)
+                for record_id, datos in zip(record_ids, datos_json)
+            ],
+        )
+        _copy_rows(
+            db, "leads", ("id", "cuenta_id", "record_id", "datos", "lote_id", "id_lead"),
+            [
+                (uuid7(), cuenta_id, record_id, datos, lote_id, first_id_lead + offset)
+                for offset, (record_id, datos) in enumerate(zip(record_ids, datos_json))
+            ],
+        )
+        return
+
+    db.execute(
+        insert(Record),
+        [
+            {"id": record_id, "cuenta_id": cuenta_id, "datos": datos, "metadata_": metadata}
+            for record_id, datos in zip(record_ids, rows)
+        ],
+    )
+    db.execute(
+        insert(Lead),
+        [
+            {
+                "cuenta_id": cuenta_id,
+                "record_id": record_id,
+                "datos": datos,
+                "lote_id": lote_id,
+                "id_lead": first_id_lead + offset,
+            }
+            for offset, (record_id, datos) in enumerate(zip(record_ids, rows))
+        ],
+    )
+
 
 # ---------------------------------------------------------------------------
 # Template download
@@ -40,8 +151,8 @@ def download_template(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> StreamingResponse:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    account_nombre = db.query(Account.nombre).filter(Account.id == account_id).scalar()
+    if account_nombre is None:
         raise HTTPException(status_code=404, detail="Account not found")
 
     fields = (
@@ -52,16 +163,17 @@ def download_template(
     )
     headers = [f[0] for f in fields]
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Leads"
+    # write_only streams rows straight into the zip instead of building
+    # a Cell object per column
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Leads")
     ws.append(headers if headers else ["campo_ejemplo"])
 
     buf = io.BytesIO()
     wb.save(buf)
     buf.seek(0)
 
-    filename = f"plantilla_{account.nombre}.xlsx"
+    filename = f"plantilla_{account_nombre}.xlsx"
     return StreamingResponse(
         buf,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
@@ -72,90 +184,114 @@ def download_template(
 # ---------------------------------------------------------------------------
 # Import Excel → create Lote + Leads
 # ---------------------------------------------------------------------------
+def _run_lote_import(
+    cuenta_id: uuid.UUID, lote_id: uuid.UUID, header: list[str], rows: Iterator[list],
+) -> None:
+    """Insert the parsed rows of a pending lote and mark it completed (or
+    failed), on a session of its own since the request's is closed by now.
+    If the process dies midway the lote stays pending until the next
+    startup marks it failed (see app.main)."""
+    db = SessionLocal()
+    try:
+        # Create leads from rows, one multi-row INSERT per table per batch.
+        # calamine reports blank cells as "" and every number as a float.
+        count = 0
+        batch: list[dict] = []
+        for row in rows:
+            datos = {}
+            for i, val in enumerate(row):
+                if i < len(header) and header[i]:
+                    datos[header[i]] = int(val) if isinstance(val, float) and val.is_integer() else val
+            if not any(v for v in datos.values() if v != ""):
+                continue  # skip empty rows
+
+            batch.append(datos)
+            if len(batch) == _IMPORT_BATCH:
+                _insert_lote_leads(db, cuenta_id, lote_id, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            _insert_lote_leads(db, cuenta_id, lote_id, batch)
+            count += len(batch)
+
+        db.execute(
+            update(Lote)
+            .where(Lote.id == lote_id)
+            .values(total_leads=count, estado=LoteStatus.COMPLETED.value)
+        )
+        db.commit()
+        lead_counts_cache.pop(cuenta_id)
+        logger.info("Lote %s imported with %d leads for account %s", lote_id, count, cuenta_id)
+    except Exception:
+        logger.exception("Import of lote %s failed", lote_id)
+        db.rollback()
+        db.execute(update(Lote).where(Lote.id == lote_id).values(estado=LoteStatus.FAILED.value))
+        db.commit()
+    finally:
+        db.close()
+
+
 @router.post(
     "/accounts/{account_id}/lotes/import",
     response_model=LoteResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Import leads from Excel file",
 )
 def import_lote(
     account_id: uuid.UUID,
     file: UploadFile,
+    background_tasks: BackgroundTasks,
     nombre: str = Form(...),
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
+    """Validate the sheet and create the lote as pending; the leads are
+    inserted after the response. Poll GET /lotes/{id} for its estado."""
+    # Only the columns the import reads, not the whole Account row
+    account = (
+        db.query(Account.id, Account.auto_crear_campos)
+        .filter(Account.id == account_id)
+        .first()
+    )
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    # Read the uploaded Excel file
+    # Read the uploaded Excel file. calamine parses the sheet natively
+    # (Rust) instead of walking the XML in Python as openpyxl does.
     try:
         content = file.file.read()
-        wb = load_workbook(filename=io.BytesIO(content), read_only=True)
-        ws = wb.active
+        sheet = CalamineWorkbook.from_filelike(io.BytesIO(content)).get_sheet_by_index(0)
+        rows = sheet.iter_rows()
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid Excel file")
 
-    rows = list(ws.iter_rows(values_only=True))
-    if len(rows) < 2:
+    header_row = next(rows, None)
+    first_row = next(rows, None)
+    if header_row is None or first_row is None:
         raise HTTPException(status_code=400, detail="Excel file must have a header row and at least one data row")
 
-    header = [str(c).strip() if c is not None else "" for c in rows[0]]
+    header = [str(c).strip() for c in header_row]
     if not any(header):
         raise HTTPException(status_code=400, detail="Header row is empty")
 
     # Auto-create fields if enabled
     if account.auto_crear_campos:
-        existing_fields = (
-            db.query(CustomField.nombre_campo)
-            .filter(CustomField.cuenta_id == account.id)
-            .all()
-        )
-        existing_names: set[str] = {f[0] for f in existing_fields}
+        existing_names = get_account_field_names(db, account.id)
         dummy_payload = {col: "" for col in header if col}
         auto_create_fields(db, account.id, dummy_payload, existing_names)
 
-    # Create Lote
     lote = Lote(
         cuenta_id=account.id,
         nombre=nombre,
         total_leads=0,
+        estado=LoteStatus.PENDING.value,
     )
     db.add(lote)
-    db.flush()
-
-    # Create leads from rows
-    count = 0
-    for row in rows[1:]:
-        datos = {}
-        for i, val in enumerate(row):
-            if i < len(header) and header[i]:
-                datos[header[i]] = val if val is not None else ""
-        if not any(v for v in datos.values() if v != ""):
-            continue  # skip empty rows
-
-        record = Record(
-            cuenta_id=account.id,
-            datos=datos,
-            metadata_={"source": "lote_import", "lote_id": str(lote.id)},
-        )
-        db.add(record)
-        db.flush()
-
-        lead = Lead(
-            cuenta_id=account.id,
-            record_id=record.id,
-            datos=datos,
-            lote_id=lote.id,
-            id_lead=next_id_lead(db, account.id),
-        )
-        db.add(lead)
-        count += 1
-
-    lote.total_leads = count
     db.commit()
-    db.refresh(lote)
 
-    logger.info("Lote '%s' created with %d leads for account %s", nombre, count, account_id)
+    background_tasks.add_task(
+        _run_lote_import, account.id, lote.id, header, chain((first_row,), rows),
+    )
+    logger.info("Lote '%s' accepted for account %s", nombre, account_id)
 
     return {
         "id": lote.id,
@@ -164,6 +300,7 @@ def import_lote(
         "lead_base_id": lote.lead_base_id,
         "base_nombre": None,
         "total_leads": lote.total_leads,
+        "estado": lote.estado,
         "created_at": lote.created_at,
     }
 
@@ -180,35 +317,15 @@ def list_lotes(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     lotes = (
-        db.query(Lote)
+        _lotes_with_base_name(db)
         .filter(Lote.cuenta_id == account_id)
         .order_by(Lote.created_at.desc())
         .all()
     )
-
-    # Fetch base names
-    base_ids = {lo.lead_base_id for lo in lotes if lo.lead_base_id}
-    base_names: dict[uuid.UUID, str] = {}
-    if base_ids:
-        bases = db.query(LeadBase.id, LeadBase.nombre).filter(LeadBase.id.in_(base_ids)).all()
-        base_names = {b.id: b.nombre for b in bases}
-
-    items = []
-    for lo in lotes:
-        items.append({
-            "id": lo.id,
-            "cuenta_id": lo.cuenta_id,
-            "nombre": lo.nombre,
-            "lead_base_id": lo.lead_base_id,
-            "base_nombre": base_names.get(lo.lead_base_id) if lo.lead_base_id else None,
-            "total_leads": lo.total_leads,
-            "created_at": lo.created_at,
-        })
+    items = [_lote_to_dict(lo) for lo in lotes]
 
     return {"items": items, "total": len(items)}
 
@@ -225,25 +342,10 @@ def get_lote(
     lote_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    lote = db.query(Lote).filter(Lote.id == lote_id).first()
+    lote = _lotes_with_base_name(db).filter(Lote.id == lote_id).first()
     if not lote:
         raise HTTPException(status_code=404, detail="Lote not found")
-
-    base_nombre = None
-    if lote.lead_base_id:
-        base = db.query(LeadBase.nombre).filter(LeadBase.id == lote.lead_base_id).first()
-        if base:
-            base_nombre = base.nombre
-
-    return {
-        "id": lote.id,
-        "cuenta_id": lote.cuenta_id,
-        "nombre": lote.nombre,
-        "lead_base_id": lote.lead_base_id,
-        "base_nombre": base_nombre,
-        "total_leads": lote.total_leads,
-        "created_at": lote.created_at,
-    }
+    return _lote_to_dict(lote)
 
 
 # ---------------------------------------------------------------------------
@@ -257,23 +359,25 @@ def delete_lote(
     lote_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    lote = db.query(Lote).filter(Lote.id == lote_id).first()
-    if not lote:
-        raise HTTPException(status_code=404, detail="Lote not found")
-
-    # Delete leads belonging to this lote (and their records)
-    leads = db.query(Lead).filter(Lead.lote_id == lote_id).all()
-    record_ids = [l.record_id for l in leads]
-
-    db.query(Lead).filter(Lead.lote_id == lote_id).delete(synchronize_session=False)
-    if record_ids:
-        db.query(Record).filter(Record.id.in_(record_ids)).delete(synchronize_session=False)
+    # Deleting the records takes their leads with them (leads.record_id is
+    # ON DELETE CASCADE), so the lote's leads are never loaded
+    deleted = db.execute(
+        delete(Record).where(
+            Record.id.in_(select(Lead.record_id).where(Lead.lote_id == lote_id))
+        )
+    ).rowcount
 
-    db.delete(lote)
+    cuenta_id = db.execute(
+        delete(Lote).where(Lote.id == lote_id).returning(Lote.cuenta_id)
+    ).scalar_one_or_none()
+    if cuenta_id is None:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Lote not found")
     db.commit()
+    lead_counts_cache.pop(cuenta_id)
 
-    logger.info("Lote %s deleted with %d leads", lote_id, len(leads))
-    return {"detail": f"Lote deleted with {len(leads)} leads"}
+    logger.info("Lote %s deleted with %d leads", lote_id, deleted)
+    return {"detail": f"Lote deleted with {deleted} leads"}
 
 
 # ---------------------------------------------------------------------------
@@ -297,19 +401,18 @@ def associate_lote(
 
     if target_base_id is not None:
         # Verify base exists and belongs to same account
-        base = db.query(LeadBase).filter(
+        base_exists = db.query(LeadBase.id).filter(
             LeadBase.id == target_base_id,
             LeadBase.cuenta_id == lote.cuenta_id,
-        ).first()
-        if not base:
+        ).scalar()
+        if base_exists is None:
             raise HTTPException(status_code=404, detail="Lead base not found or belongs to different account")
     else:
         # Disassociate → move leads to default base of the account
-        default_base = db.query(LeadBase).filter(
+        target_base_id = db.query(LeadBase.id).filter(
             LeadBase.cuenta_id == lote.cuenta_id,
             LeadBase.es_default.is_(True),
-        ).first()
-        target_base_id = default_base.id if default_base else None
+        ).scalar()
 
     # Update lote
     lote.lead_base_id = body.lead_base_id  # store the actual request value (None if disassociate)
@@ -322,6 +425,7 @@ def associate_lote(
     )
 
     db.commit()
+    lead_counts_cache.pop(lote.cuenta_id)
 
     logger.info(
         "Lote %s associated to base %s, %d leads moved",
@@ -349,8 +453,8 @@ def list_lote_leads(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    lote = db.query(Lote).filter(Lote.id == lote_id).first()
-    if not lote:
+    lote_nombre = db.query(Lote.nombre).filter(Lote.id == lote_id).scalar()
+    if lote_nombre is None:
         raise HTTPException(status_code=404, detail="Lote not found")
 
     query = db.query(Lead).filter(Lead.lote_id == lote_id)
@@ -379,7 +483,7 @@ def list_lote_leads(
             "lead_base_id": lead.lead_base_id,
             "base_nombre": base_names.get(lead.lead_base_id) if lead.lead_base_id else None,
             "lote_id": lead.lote_id,
-            "lote_nombre": lote.nombre,
+            "lote_nombre": lote_nombre,
             "datos": lead.datos,
             "created_at": lead.created_at,
         })
@@ -5,9 +5,9 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.record import Record
 from app.schemas.record import RecordListResponse, RecordResponse
+from app.services.account_lookup import assert_account_exists
 
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
@@ -23,9 +23,7 @@ def list_records(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     query = db.query(Record).filter(Record.cuenta_id == account_id)
     total = query.count()
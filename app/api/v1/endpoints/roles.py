@@ -2,27 +2,32 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.permissions import ALL_PERMISSIONS
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.role import Role
 from app.models.user import User
 from app.schemas.role import RoleCreate, RoleListResponse, RoleResponse, RoleUpdate
+from app.services.account_lookup import assert_account_exists
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
 
+_VALID_PERMISSIONS = frozenset(ALL_PERMISSIONS)
+_VALID_PERMISSIONS_DESC = ", ".join(ALL_PERMISSIONS)
+
+
 def _validate_permisos(permisos: list[str]) -> None:
-    invalid = [p for p in permisos if p not in ALL_PERMISSIONS]
+    invalid = [p for p in permisos if p not in _VALID_PERMISSIONS]
     if invalid:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid permissions: {', '.join(invalid)}. "
-            f"Valid permissions: {', '.join(ALL_PERMISSIONS)}",
+            f"Valid permissions: {_VALID_PERMISSIONS_DESC}",
         )
 
 
@@ -37,9 +42,7 @@ def create_role(
     body: RoleCreate,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     _validate_permisos(body.permisos)
 
@@ -50,8 +53,8 @@ def create_role(
         permisos=body.permisos,
     )
     db.add(role)
+    # id and created_at come back through the INSERT's RETURNING (eager_defaults)
     db.commit()
-    db.refresh(role)
 
     logger.info("Role '%s' created for account %s", role.nombre, account_id)
 
@@ -75,9 +78,7 @@ def list_roles(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     roles = (
         db.query(Role)
@@ -86,16 +87,23 @@ def list_roles(
         .all()
     )
 
+    # Users per role in one GROUP BY instead of a COUNT per role
+    user_counts = dict(
+        db.query(User.role_id, func.count(User.id))
+        .filter(User.role_id.in_([r.id for r in roles]))
+        .group_by(User.role_id)
+        .all()
+    )
+
     items = []
     for role in roles:
-        user_count = db.query(User).filter(User.role_id == role.id).count()
         items.append({
             "id": role.id,
             "cuenta_id": role.cuenta_id,
             "nombre": role.nombre,
             "descripcion": role.descripcion,
             "permisos": role.permisos,
-            "total_users": user_count,
+            "total_users": user_counts.get(role.id, 0),
             "created_at": role.created_at,
         })
 
@@ -151,7 +159,6 @@ def update_role(
         role.permisos = body.permisos
 
     db.commit()
-    db.refresh(role)
 
     user_count = db.query(User).filter(User.role_id == role.id).count()
 
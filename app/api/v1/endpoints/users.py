@@ -2,21 +2,24 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 
 from app.core.auth import hash_password
 from app.core.database import get_db
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.role import Role
 from app.models.user import User
 from app.schemas.user import UserCreate, UserListResponse, UserResponse, UserUpdate
+from app.services.account_lookup import assert_account_exists
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
 
-def _user_to_dict(user: User, role_nombre: str | None = None) -> dict:
+def _user_to_dict(user: User) -> dict:
+    """Serialise a user; ``user.role`` must already be loaded or assigned."""
     return {
         "id": user.id,
         "cuenta_id": user.cuenta_id,
@@ -25,13 +28,50 @@ def _user_to_dict(user: User, role_nombre: str | None = None) -> dict:
         "email": user.email,
         "username": user.username,
         "role_id": user.role_id,
-        "role_nombre": role_nombre,
+        "role_nombre": user.role_nombre,
         "activo": user.activo,
         "created_at": user.created_at,
         "updated_at": user.updated_at,
     }
 
 
+def _find_duplicate(
+    db: Session,
+    cuenta_id: uuid.UUID,
+    email: str | None,
+    username: str | None,
+    exclude_id: uuid.UUID | None = None,
+) -> str | None:
+    """Return "email" or "username" when another user of the account already
+    uses it; both are checked in a single SELECT."""
+    conditions = []
+    if email is not None:
+        conditions.append(func.lower(User.email) == email.lower())
+    if username is not None:
+        conditions.append(User.username == username)
+    if not conditions:
+        return None
+
+    query = db.query(func.lower(User.email), User.username).filter(
+        User.cuenta_id == cuenta_id, or_(*conditions)
+    )
+    if exclude_id is not None:
+        query = query.filter(User.id != exclude_id)
+    match = query.first()
+    if match is None:
+        return None
+    return "email" if email is not None and match[0] == email.lower() else "username"
+
+
+def _commit_user(db: Session) -> None:
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request took the email/username after the check above
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Email or username already in use in this account")
+
+
 @router.post(
     "/accounts/{account_id}/users",
     response_model=UserResponse,
@@ -43,33 +83,25 @@ def create_user(
     body: UserCreate,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
-    # Check email uniqueness within account
-    existing = db.query(User).filter(
-        User.cuenta_id == account_id, User.email == body.email
-    ).first()
-    if existing:
-        raise HTTPException(status_code=409, detail="A user with this email already exists in this account")
+    assert_account_exists(db, account_id)
 
-    # Check username uniqueness within account
-    existing_user = db.query(User).filter(
-        User.cuenta_id == account_id, User.username == body.username
-    ).first()
-    if existing_user:
+    # Email (case-insensitive) and username are unique within the account
+    duplicate = _find_duplicate(db, account_id, body.email, body.username)
+    if duplicate == "email":
+        raise HTTPException(status_code=409, detail="A user with this email already exists in this account")
+    if duplicate == "username":
         raise HTTPException(status_code=409, detail="A user with this username already exists in this account")
 
     # Validate role if provided
-    role_nombre = None
+    role = None
     if body.role_id:
-        role = db.query(Role).filter(
+        # Only nombre is needed: the Role is assigned to the user and its name
+        # is what the response reports, so no second lookup after commit
+        role = db.query(Role).options(load_only(Role.nombre)).filter(
             Role.id == body.role_id, Role.cuenta_id == account_id
         ).first()
         if not role:
             raise HTTPException(status_code=404, detail="Role not found in this account")
-        role_nombre = role.nombre
 
     user = User(
         cuenta_id=account_id,
@@ -78,14 +110,14 @@ def create_user(
         email=body.email,
         username=body.username,
         password_hash=hash_password(body.password),
-        role_id=body.role_id,
+        role=role,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    # Server defaults come back through the INSERT's RETURNING (eager_defaults)
+    _commit_user(db)
 
     logger.info("User '%s' created for account %s", user.username, account_id)
-    return _user_to_dict(user, role_nombre)
+    return _user_to_dict(user)
 
 
 @router.get(
@@ -99,30 +131,27 @@ def list_users(
     page_size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     query = db.query(User).filter(User.cuenta_id == account_id)
     total = query.count()
+    # Roles for the whole page arrive in one IN (...) SELECT; neither the
+    # password hash nor the roles' permisos are read here
     users = (
-        query.order_by(User.created_at.desc())
+        query.options(
+            load_only(
+                User.id, User.cuenta_id, User.nombre, User.apellido, User.email,
+                User.username, User.role_id, User.activo, User.created_at, User.updated_at,
+            ),
+            selectinload(User.role).load_only(Role.nombre),
+        )
+        .order_by(User.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
         .all()
     )
 
-    # Fetch role names
-    role_ids = {u.role_id for u in users if u.role_id}
-    role_names: dict[uuid.UUID, str] = {}
-    if role_ids:
-        roles = db.query(Role.id, Role.nombre).filter(Role.id.in_(role_ids)).all()
-        role_names = {r.id: r.nombre for r in roles}
-
-    items = [
-        _user_to_dict(u, role_names.get(u.role_id) if u.role_id else None)
-        for u in users
-    ]
+    items = [_user_to_dict(u) for u in users]
 
     return {"items": items, "total": total}
 
@@ -136,17 +165,10 @@ def get_user(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id, options=[joinedload(User.role).load_only(Role.nombre)])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-
-    role_nombre = None
-    if user.role_id:
-        role = db.query(Role).filter(Role.id == user.role_id).first()
-        if role:
-            role_nombre = role.nombre
-
-    return _user_to_dict(user, role_nombre)
+    return _user_to_dict(user)
 
 
 @router.put(
@@ -159,51 +181,40 @@ def update_user(
     body: UserUpdate,
     db: Session = Depends(get_db),
 ) -> dict:
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id, options=[joinedload(User.role).load_only(Role.nombre)])
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    duplicate = _find_duplicate(db, user.cuenta_id, body.email, body.username, exclude_id=user_id)
+    if duplicate == "email":
+        raise HTTPException(status_code=409, detail="Email already in use in this account")
+    if duplicate == "username":
+        raise HTTPException(status_code=409, detail="Username already in use in this account")
+
     if body.nombre is not None:
         user.nombre = body.nombre
     if body.apellido is not None:
         user.apellido = body.apellido
     if body.email is not None:
-        # Check uniqueness
-        existing = db.query(User).filter(
-            User.cuenta_id == user.cuenta_id, User.email == body.email, User.id != user_id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=409, detail="Email already in use in this account")
         user.email = body.email
     if body.username is not None:
-        existing = db.query(User).filter(
-            User.cuenta_id == user.cuenta_id, User.username == body.username, User.id != user_id
-        ).first()
-        if existing:
-            raise HTTPException(status_code=409, detail="Username already in use in this account")
         user.username = body.username
     if body.password is not None:
         user.password_hash = hash_password(body.password)
     if body.role_id is not None:
-        role = db.query(Role).filter(
+        role = db.query(Role).options(load_only(Role.nombre)).filter(
             Role.id == body.role_id, Role.cuenta_id == user.cuenta_id
         ).first()
         if not role:
             raise HTTPException(status_code=404, detail="Role not found in this account")
-        user.role_id = body.role_id
+        user.role = role
     if body.activo is not None:
         user.activo = body.activo
 
-    db.commit()
-    db.refresh(user)
-
-    role_nombre = None
-    if user.role_id:
-        role = db.query(Role).filter(Role.id == user.role_id).first()
-        if role:
-            role_nombre = role.nombre
-
-    return _user_to_dict(user, role_nombre)
+    # No refresh: updated_at comes back through the UPDATE's RETURNING and
+    # the role is already loaded (or was just assigned)
+    _commit_user(db)
+    return _user_to_dict(user)
 
 
 @router.delete(
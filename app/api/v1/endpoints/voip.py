@@ -9,12 +9,11 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.lead import Lead
 from app.models.voip import (
     Agent, AgentStatus, CallEvent, CallRecord, Campaign, CampaignAgent,
@@ -34,19 +33,13 @@ from app.schemas.voip import (
     SipProviderCreate, SipProviderListResponse, SipProviderResponse, SipProviderUpdate,
     SipTrunkCreate, SipTrunkListResponse, SipTrunkResponse, SipTrunkUpdate,
 )
+from app.services.account_lookup import assert_account_exists
 from app.services.ami_manager import ami_manager
-from app.services.dialer_engine import manual_call, update_campaign_stats
+from app.services.dialer_engine import is_dnc, manual_call, phone_digits, update_campaign_stats
 
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
-
-# ─── Helpers ──────────────────────────────────────────────────────────────────
-
-def _get_account(db: Session, account_id: uuid.UUID) -> Account:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-    return account
+_BULK_ADD_BATCH = 1000  # leads read and campaign_leads inserted per round trip
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -62,7 +55,7 @@ def _get_account(db: Session, account_id: uuid.UUID) -> Account:
 def create_sip_provider(
     account_id: uuid.UUID, body: SipProviderCreate, db: Session = Depends(get_db),
 ):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     provider = SipProvider(cuenta_id=account_id, nombre=body.nombre, pais=body.pais, notas=body.notas)
     db.add(provider)
     db.commit()
@@ -76,7 +69,7 @@ def create_sip_provider(
     summary="List SIP providers",
 )
 def list_sip_providers(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(SipProvider).filter(SipProvider.cuenta_id == account_id).order_by(SipProvider.created_at).all()
     return {"items": items, "total": len(items)}
 
@@ -135,7 +128,7 @@ def create_sip_trunk(provider_id: uuid.UUID, body: SipTrunkCreate, db: Session =
     summary="List all SIP trunks for an account",
 )
 def list_sip_trunks(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(SipTrunk).filter(SipTrunk.cuenta_id == account_id).order_by(SipTrunk.created_at).all()
     return {"items": items, "total": len(items)}
 
@@ -172,7 +165,7 @@ def delete_sip_trunk(trunk_id: uuid.UUID, db: Session = Depends(get_db)):
     summary="Create a PBX node",
 )
 def create_pbx_node(account_id: uuid.UUID, body: PbxNodeCreate, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     node = PbxNode(cuenta_id=account_id)
     for field, value in body.model_dump().items():
         setattr(node, field, value)
@@ -188,7 +181,7 @@ def create_pbx_node(account_id: uuid.UUID, body: PbxNodeCreate, db: Session = De
     summary="List PBX nodes",
 )
 def list_pbx_nodes(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(PbxNode).filter(PbxNode.cuenta_id == account_id).order_by(PbxNode.created_at).all()
     return {"items": items, "total": len(items)}
 
@@ -237,7 +230,7 @@ def check_pbx_node_health(node_id: uuid.UUID, db: Session = Depends(get_db)):
     summary="Create an agent",
 )
 def create_agent(account_id: uuid.UUID, body: AgentCreate, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     # Check extension uniqueness within account
     existing = db.query(Agent).filter(
         Agent.cuenta_id == account_id, Agent.extension == body.extension
@@ -259,7 +252,7 @@ def create_agent(account_id: uuid.UUID, body: AgentCreate, db: Session = Depends
     summary="List agents",
 )
 def list_agents(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(Agent).filter(Agent.cuenta_id == account_id).order_by(Agent.created_at).all()
     return {"items": items, "total": len(items)}
 
@@ -328,7 +321,7 @@ def delete_agent(agent_id: uuid.UUID, db: Session = Depends(get_db)):
     summary="Create a disposition",
 )
 def create_disposition(account_id: uuid.UUID, body: DispositionCreate, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     existing = db.query(Disposition).filter(
         Disposition.cuenta_id == account_id, Disposition.codigo == body.codigo
     ).first()
@@ -349,7 +342,7 @@ def create_disposition(account_id: uuid.UUID, body: DispositionCreate, db: Sessi
     summary="List dispositions",
 )
 def list_dispositions(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(Disposition).filter(Disposition.cuenta_id == account_id).order_by(Disposition.created_at).all()
     return {"items": items, "total": len(items)}
 
@@ -386,7 +379,7 @@ def delete_disposition(disposition_id: uuid.UUID, db: Session = Depends(get_db))
     summary="Create a campaign",
 )
 def create_campaign(account_id: uuid.UUID, body: CampaignCreate, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     campaign = Campaign(cuenta_id=account_id)
     for field, value in body.model_dump().items():
         setattr(campaign, field, value)
@@ -402,7 +395,7 @@ def create_campaign(account_id: uuid.UUID, body: CampaignCreate, db: Session = D
     summary="List campaigns",
 )
 def list_campaigns(account_id: uuid.UUID, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     items = db.query(Campaign).filter(Campaign.cuenta_id == account_id).order_by(Campaign.created_at.desc()).all()
     return {"items": items, "total": len(items)}
 
@@ -580,15 +573,13 @@ def add_campaign_lead(campaign_id: uuid.UUID, body: CampaignLeadAdd, db: Session
     ).first()
     if existing:
         raise HTTPException(status_code=400, detail="Lead already in this campaign")
-    # Check DNC
-    is_dnc = db.query(DncEntry).filter(
-        DncEntry.cuenta_id == campaign.cuenta_id, DncEntry.telefono == body.telefono
-    ).first()
+    # Check DNC (on digits, like the dialer)
+    in_dnc = is_dnc(db, campaign.cuenta_id, body.telefono)
     cl = CampaignLead(
         campaign_id=campaign_id,
         lead_id=body.lead_id,
         telefono=body.telefono,
-        estado=CampaignLeadStatus.DNC.value if is_dnc else CampaignLeadStatus.PENDING.value,
+        estado=CampaignLeadStatus.DNC.value if in_dnc else CampaignLeadStatus.PENDING.value,
     )
     db.add(cl)
     update_campaign_stats(db, campaign_id)
@@ -615,58 +606,71 @@ def bulk_add_campaign_leads(campaign_id: uuid.UUID, body: CampaignLeadBulkAdd, d
     else:
         raise HTTPException(status_code=400, detail="source_type must be 'lead_base' or 'lote'")
 
-    leads = query.all()
-    if not leads:
-        raise HTTPException(status_code=404, detail="No leads found in the specified source")
-
     # Load existing campaign leads to avoid duplicates
     existing_lead_ids = set(
         row[0] for row in
         db.query(CampaignLead.lead_id).filter(CampaignLead.campaign_id == campaign_id).all()
     )
 
-    # Load DNC numbers
-    dnc_numbers = set(
+    # Load DNC numbers as digits only, the same match dialer_engine.is_dnc
+    # makes, so "+54 11 5555-0000" is flagged here and not first by the dialer
+    dnc_digits = set(
         row[0] for row in
-        db.query(DncEntry.telefono).filter(DncEntry.cuenta_id == campaign.cuenta_id).all()
+        db.query(func.regexp_replace(DncEntry.telefono, r"\D", "", "g"))
+        .filter(DncEntry.cuenta_id == campaign.cuenta_id)
+        .all()
     )
 
     added = 0
     skipped = 0
     dnc_count = 0
-
-    for lead in leads:
-        if lead.id in existing_lead_ids:
+    processed = 0
+    batch: list[dict] = []
+
+    # Stream (id, datos) pairs in batches over a server-side cursor instead
+    # of materialising every Lead of a large base in memory at once, and
+    # write each batch with one executemany INSERT rather than keeping a
+    # CampaignLead object per lead in the session.
+    for lead_id, datos in query.with_entities(Lead.id, Lead.datos).yield_per(_BULK_ADD_BATCH):
+        processed += 1
+        if lead_id in existing_lead_ids:
             skipped += 1
             continue
 
         # Extract phone from datos
         telefono = None
-        if lead.datos and isinstance(lead.datos, dict):
-            telefono = lead.datos.get(body.campo_telefono)
+        if datos and isinstance(datos, dict):
+            telefono = datos.get(body.campo_telefono)
         if not telefono:
             skipped += 1
             continue
 
         telefono = str(telefono).strip()
-        is_dnc = telefono in dnc_numbers
-
-        cl = CampaignLead(
-            campaign_id=campaign_id,
-            lead_id=lead.id,
-            telefono=telefono,
-            estado=CampaignLeadStatus.DNC.value if is_dnc else CampaignLeadStatus.PENDING.value,
-        )
-        db.add(cl)
-        if is_dnc:
+        in_dnc = phone_digits(telefono) in dnc_digits
+
+        batch.append({
+            "campaign_id": campaign_id,
+            "lead_id": lead_id,
+            "telefono": telefono,
+            "estado": CampaignLeadStatus.DNC.value if in_dnc else CampaignLeadStatus.PENDING.value,
+        })
+        if in_dnc:
             dnc_count += 1
         else:
             added += 1
+        if len(batch) == _BULK_ADD_BATCH:
+            db.execute(insert(CampaignLead), batch)
+            batch = []
+    if batch:
+        db.execute(insert(CampaignLead), batch)
+
+    if not processed:
+        raise HTTPException(status_code=404, detail="No leads found in the specified source")
 
     update_campaign_stats(db, campaign_id)
     db.commit()
 
-    return {"added": added, "skipped": skipped, "dnc": dnc_count, "total_processed": len(leads)}
+    return {"added": added, "skipped": skipped, "dnc": dnc_count, "total_processed": processed}
 
 
 @router.get(
@@ -856,7 +860,7 @@ def list_call_records(
     page_size: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
 ):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     query = db.query(CallRecord).filter(CallRecord.cuenta_id == account_id)
     if campaign_id:
         query = query.filter(CallRecord.campaign_id == campaign_id)
@@ -899,7 +903,7 @@ def get_call_events(record_id: uuid.UUID, db: Session = Depends(get_db)):
     summary="Add number to DNC list",
 )
 def add_dnc(account_id: uuid.UUID, body: DncCreate, db: Session = Depends(get_db)):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     existing = db.query(DncEntry).filter(
         DncEntry.cuenta_id == account_id, DncEntry.telefono == body.telefono
     ).first()
@@ -923,7 +927,7 @@ def list_dnc(
     page_size: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
 ):
-    _get_account(db, account_id)
+    assert_account_exists(db, account_id)
     query = db.query(DncEntry).filter(DncEntry.cuenta_id == account_id)
     total = query.count()
     items = query.order_by(DncEntry.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
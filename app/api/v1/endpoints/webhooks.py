@@ -6,7 +6,6 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import verify_admin_key
-from app.models.account import Account
 from app.models.webhook import Webhook, WebhookLog
 from app.schemas.webhook import (
     WEBHOOK_EVENTS,
@@ -18,18 +17,23 @@ from app.schemas.webhook import (
     WebhookTestResponse,
     WebhookUpdate,
 )
+from app.services.account_lookup import assert_account_exists
 from app.services.webhook_dispatcher import deliver_single
 
 logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_admin_key)])
 
 
+_VALID_EVENTS = frozenset(WEBHOOK_EVENTS)
+_VALID_EVENTS_DESC = ", ".join(WEBHOOK_EVENTS)
+
+
 def _validate_eventos(eventos: list[str]) -> None:
-    invalid = [e for e in eventos if e not in WEBHOOK_EVENTS]
+    invalid = [e for e in eventos if e not in _VALID_EVENTS]
     if invalid:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid events: {', '.join(invalid)}. Valid: {', '.join(WEBHOOK_EVENTS)}",
+            detail=f"Invalid events: {', '.join(invalid)}. Valid: {_VALID_EVENTS_DESC}",
         )
 
 
@@ -46,9 +50,7 @@ def create_webhook(
     body: WebhookCreate,
     db: Session = Depends(get_db),
 ) -> Webhook:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     _validate_eventos(body.eventos)
 
@@ -77,9 +79,7 @@ def list_webhooks(
     account_id: uuid.UUID,
     db: Session = Depends(get_db),
 ) -> dict:
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
+    assert_account_exists(db, account_id)
 
     items = (
         db.query(Webhook)
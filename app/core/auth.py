@@ -1,6 +1,8 @@
 """
 JWT utilities and FastAPI dependencies for user authentication.
 """
+import functools
+import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -8,7 +10,7 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.config import settings
 from app.core.database import get_db
@@ -21,12 +23,25 @@ JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours
 
 
+@functools.lru_cache(maxsize=1)
+def _signing_key() -> bytes:
+    """SECRET_KEY as bytes, encoded once for the process lifetime."""
+    return settings.SECRET_KEY.encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """Hash compared against when the user doesn't exist, so the response
+    takes as long as a wrong password (no username enumeration by timing)."""
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
+
 def hash_password(plain: str) -> str:
     return pwd_context.hash(plain)
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+def verify_password(plain: str, hashed: str | None) -> bool:
+    return pwd_context.verify(plain, hashed if hashed is not None else _dummy_hash())
 
 
 def create_access_token(
@@ -44,12 +59,12 @@ def create_access_token(
         "iat": now,
         "exp": now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=JWT_ALGORITHM)
+    return jwt.encode(payload, _signing_key(), algorithm=JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
     try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        return jwt.decode(token, _signing_key(), algorithms=[JWT_ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -67,7 +82,12 @@ def get_current_user(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
     data = decode_token(credentials.credentials)
-    user = db.query(User).filter(User.id == data["sub"], User.activo.is_(True)).first()
+    user = (
+        db.query(User)
+        .options(joinedload(User.role))
+        .filter(User.id == data["sub"], User.activo.is_(True))
+        .first()
+    )
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
     return user
@@ -0,0 +1,79 @@
+"""
+Small in-process TTL caches for hot, rarely-changing lookups.
+
+Each worker process keeps its own copy, so writers pop the affected key
+after committing and the TTL bounds how stale other workers can be.
+Values must be plain data (schemas, tuples, ids) — never ORM instances,
+which stay bound to the session that loaded them.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# account_id -> AccountResponse snapshot
+account_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# account_id -> True for ids known to exist; accounts are only soft-deleted,
+# so a cached hit never goes stale (misses are not cached)
+account_exists_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# api_key -> (id, nombre, auto_crear_campos) of an active account, for ingest
+api_key_cache = TTLCache(maxsize=1024, ttl=30)
+
+# account_id -> frozenset of registered CustomField names
+field_names_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# account_id -> {lead_base_id: lead count}; ingest-driven growth is left to
+# the TTL, admin moves/imports/deletes pop the entry
+lead_counts_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# (account_id, field names) -> rendered bulk-update template .xlsx bytes;
+# the key changes with the field list, so no invalidation is needed
+update_template_cache = TTLCache(maxsize=256, ttl=3600)
+
+# (client ip, cuenta_id, username) -> consecutive failed logins
+failed_login_cache = TTLCache(maxsize=100_000, ttl=60)
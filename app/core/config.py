@@ -10,6 +10,15 @@ class Settings(BaseSettings):
     AUTH_ENABLED: bool = False
     PORT: int = 8000
 
+    # Connection pool (per worker process; keep workers * (size + overflow)
+    # under the server's max_connections)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 300
+    DB_POOL_TIMEOUT: int = 30
+    # Compiled-SQL cache entries per engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+
     # Campos excluidos de la auto-creación
     EXCLUDED_FIELDS: list[str] = ["IDLOTE", "USUARIO_PREASIGNADO"]
 
@@ -5,12 +5,35 @@ from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False)
+# No pre-ping (it costs a SELECT 1 round-trip per checkout); dead
+# connections are caught by TCP keepalives and recycled after
+# DB_POOL_RECYCLE seconds instead.
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=False,
+    pool_use_lifo=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args={
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+    },
+)
+# Instances stay usable after commit without a reload SELECT; endpoints
+# that need database-computed values read them back via RETURNING/refresh.
+SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated INSERT and UPDATE values (created_at,
+    # updated_at) through RETURNING in the same statement, so instances
+    # are complete after commit without a refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -0,0 +1,27 @@
+"""
+Time-ordered primary key generation.
+
+Random UUIDv4 keys land on random B-tree leaves, so the PK index of every
+append-heavy table (records, leads, logs) splits pages all over the place.
+UUIDv7 (RFC 9562) starts with a 48-bit millisecond timestamp, so new keys
+always append to the right edge of the index while staying globally unique.
+
+PostgreSQL 16 has no native uuidv7(), so ids are generated app-side.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a new RFC 9562 version 7 UUID."""
+    ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                      # version
+    value |= ((rand >> 62) & 0xFFF) << 64   # rand_a (12 bits)
+    value |= 0b10 << 62                     # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF   # rand_b (62 bits)
+    return uuid.UUID(int=value)
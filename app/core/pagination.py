@@ -0,0 +1,47 @@
+"""
+Pagination helpers.
+
+Keyset (seek) cursors: a cursor is the ``(created_at, id)`` of the last row
+of the previous page, so the next page is an index range read instead of
+OFFSET's scan-and-discard.
+
+Page/total listings that still use OFFSET get their total from a window
+count on the page query itself rather than a second COUNT round-trip.
+"""
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        ts, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(ts), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def page_with_total(query: Query, page: int, page_size: int) -> tuple[list, int]:
+    """One page of an ordered ORM query plus the unpaginated total, in a
+    single round-trip via COUNT(*) OVER (). A page past the end has no row
+    to carry the total, so only then is a separate COUNT issued."""
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    return [], query.count() if page > 1 else 0
@@ -1,3 +1,5 @@
+import secrets
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -13,7 +15,9 @@ def verify_admin_key(
     if not settings.AUTH_ENABLED:
         return None
 
-    if not credentials or credentials.credentials != settings.ADMIN_API_KEY:
+    if not credentials or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.ADMIN_API_KEY.encode()
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid admin API key",
@@ -1,15 +1,26 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.router import api_router
 from app.core.database import Base, engine
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
+# Request threads only enqueue log records; a single listener thread does
+# the stderr I/O.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # final format happens in the listener
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -82,9 +93,6 @@ try:
             conn.execute(text(
                 "ALTER TABLE leads ADD COLUMN id_lead INTEGER"
             ))
-            conn.execute(text(
-                "CREATE INDEX IF NOT EXISTS ix_leads_id_lead ON leads (id_lead)"
-            ))
             # Backfill existing leads
             conn.execute(text("""
                 UPDATE leads
@@ -96,6 +104,10 @@ try:
                 ) sub
                 WHERE leads.id = sub.id
             """))
+            # Index after the backfill so the UPDATE doesn't maintain it
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_leads_id_lead ON leads (id_lead)"
+            ))
             conn.commit()
             logger.info("Added id_lead column to leads table and backfilled")
         else:
@@ -103,10 +115,45 @@ try:
 except Exception as e:
     logger.error("Failed to add id_lead column: %s", e)
 
+# Keep monthly log partitions ahead of time (see migration 018)
+try:
+    from app.services.log_partitions import ensure_log_partitions
+
+    with engine.connect() as conn:
+        ensure_log_partitions(conn)
+        conn.commit()
+except Exception as e:
+    logger.error("Failed to create log partitions: %s", e)
+
+# Lote imports run as background tasks of the process that accepted them, so
+# one still pending after an hour lost its task to a restart or crash. The
+# grace period leaves imports running in another worker alone.
+try:
+    from sqlalchemy import text
+
+    from app.models.lote import LoteStatus
+
+    with engine.connect() as conn:
+        stale = conn.execute(
+            text(
+                "UPDATE lotes SET estado = :failed "
+                "WHERE estado = :pending AND created_at < now() - interval '1 hour'"
+            ),
+            {"failed": LoteStatus.FAILED.value, "pending": LoteStatus.PENDING.value},
+        ).rowcount
+        conn.commit()
+        if stale:
+            logger.warning("Marked %d interrupted lote imports as failed", stale)
+except Exception as e:
+    logger.error("Failed to reset pending lotes: %s", e)
+
 app = FastAPI(
     title="Centro de Control - Multi-Tenant CRM Ingest",
     description="Backend multi-tenant para ingesta de datos de CRM con auto-creación de campos.",
     version="1.0.0",
+    # orjson encodes the nested automation/lead payloads several times faster
+    # than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
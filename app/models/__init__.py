@@ -1,7 +1,7 @@
 from app.models.account import Account
 from app.models.automation import Automation, AutomationAction, AutomationCondition, AutomationLog
 from app.models.field import CustomField, FieldType
-from app.models.lead import Lead
+from app.models.lead import Lead, LeadCounter
 from app.models.lead_base import LeadBase
 from app.models.lote import Lote
 from app.models.record import Record
@@ -18,6 +18,6 @@ __all__ = [
     "Account", "Agent", "Automation", "AutomationAction", "AutomationCondition", "AutomationLog",
     "CallEvent", "CallRecord", "Campaign", "CampaignAgent", "CampaignLead",
     "CustomField", "Disposition", "DncEntry", "FieldType",
-    "Lead", "LeadBase", "Lote", "PbxNode", "Record",
+    "Lead", "LeadBase", "LeadCounter", "Lote", "PbxNode", "Record",
     "Role", "RoutingRule", "SipProvider", "SipTrunk", "User", "Webhook", "WebhookLog",
 ]
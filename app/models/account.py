@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,13 +10,19 @@ from app.core.database import Base
 
 class Account(Base):
     __tablename__ = "accounts"
+    __table_args__ = (
+        Index(
+            "ix_accounts_active_created", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("activo IS TRUE"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
     )
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     api_key: Mapped[str] = mapped_column(
-        String(64), unique=True, nullable=False, index=True
+        String(64), unique=True, nullable=False
     )
     activo: Mapped[bool] = mapped_column(Boolean, default=True)
     auto_crear_campos: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -1,11 +1,12 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Automation(Base):
@@ -14,12 +15,20 @@ class Automation(Base):
     """
 
     __tablename__ = "automations"
+    __table_args__ = (
+        Index(
+            "ix_automations_cuenta_trigger_active", "cuenta_id", "trigger_tipo",
+            postgresql_where=text("activo IS TRUE"),
+        ),
+        Index("ix_automations_cuenta_created", "cuenta_id", text("created_at DESC")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     descripcion: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -60,7 +69,8 @@ class AutomationCondition(Base):
     __tablename__ = "automation_conditions"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     automation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("automations.id", ondelete="CASCADE"), index=True
@@ -86,7 +96,8 @@ class AutomationAction(Base):
     __tablename__ = "automation_actions"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     automation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("automations.id", ondelete="CASCADE"), index=True
@@ -105,15 +116,33 @@ class AutomationAction(Base):
 
 
 class AutomationLog(Base):
-    """Execution log for an automation run."""
+    """Execution log for an automation run.
+
+    Partitioned by month on created_at (migration 018); the table's primary
+    key is (id, created_at), id alone is enough for the ORM identity.
+    """
 
     __tablename__ = "automation_logs"
+    __table_args__ = (
+        Index(
+            "ix_automation_logs_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_automation_logs_lead_id", "lead_id",
+            postgresql_where=text("lead_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_automation_logs_automation_created",
+            "automation_id", text("created_at DESC"), text("id DESC"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     automation_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("automations.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("automations.id", ondelete="CASCADE")
     )
     lead_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), nullable=True
@@ -126,7 +155,7 @@ class AutomationLog(Base):
     )
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     automation: Mapped["Automation"] = relationship(back_populates="logs")
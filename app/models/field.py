@@ -2,7 +2,9 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import (
+    Boolean, CheckConstraint, DateTime, ForeignKey, Index, String, UniqueConstraint, func, text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,13 +24,19 @@ class CustomField(Base):
     __tablename__ = "custom_fields"
     __table_args__ = (
         UniqueConstraint("cuenta_id", "nombre_campo", name="uq_account_field_name"),
+        CheckConstraint(
+            "tipo_dato IN ('string', 'number', 'boolean', 'datetime', 'email', 'phone')",
+            name="ck_custom_fields_tipo_dato",
+        ),
+        Index("ix_custom_fields_cuenta_created", "cuenta_id", text("created_at DESC"), text("id DESC")),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     nombre_campo: Mapped[str] = mapped_column(String(255), nullable=False)
     tipo_dato: Mapped[str] = mapped_column(String(20), default="string")
@@ -1,25 +1,34 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Lead(Base):
     __tablename__ = "leads"
+    __table_args__ = (
+        Index(
+            "ix_leads_cuenta_created", "cuenta_id", text("created_at DESC"),
+            postgresql_include=["id_lead", "lead_base_id", "lote_id"],
+        ),
+        Index("ix_leads_lead_base_created", "lead_base_id", text("created_at DESC")),
+        Index("ix_leads_cuenta_id_lead", "cuenta_id", "id_lead"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     id_lead: Mapped[int | None] = mapped_column(
-        Integer, nullable=True, index=True,
+        Integer, nullable=True,
         comment="Human-readable sequential ID, unique per account",
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     record_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -28,7 +37,7 @@ class Lead(Base):
     )
     lead_base_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("lead_bases.id", ondelete="SET NULL"),
-        nullable=True, index=True,
+        nullable=True,
     )
     lote_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("lotes.id", ondelete="SET NULL"),
@@ -36,10 +45,21 @@ class Lead(Base):
     )
     datos: Mapped[dict] = mapped_column(JSONB, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     account: Mapped["Account"] = relationship(back_populates="leads")  # noqa: F821
     record: Mapped["Record"] = relationship(back_populates="lead")  # noqa: F821
     lead_base: Mapped["LeadBase | None"] = relationship(back_populates="leads")  # noqa: F821
     lote: Mapped["Lote | None"] = relationship(back_populates="leads")  # noqa: F821
+
+
+class LeadCounter(Base):
+    """Per-account id_lead counter, advanced atomically by next_id_lead()."""
+
+    __tablename__ = "lead_counters"
+
+    cuenta_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True
+    )
+    next_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,9 +10,17 @@ from app.core.database import Base
 
 class LeadBase(Base):
     __tablename__ = "lead_bases"
+    __table_args__ = (
+        # One default base per account, enforced by the database
+        Index(
+            "uq_lead_bases_default_per_account", "cuenta_id",
+            unique=True, postgresql_where=text("es_default IS TRUE"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
@@ -20,11 +28,12 @@ class LeadBase(Base):
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     es_default: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     account: Mapped["Account"] = relationship(back_populates="lead_bases")  # noqa: F821
     leads: Mapped[list["Lead"]] = relationship(back_populates="lead_base")  # noqa: F821
     routing_rules: Mapped[list["RoutingRule"]] = relationship(  # noqa: F821
-        back_populates="lead_base", cascade="all, delete-orphan"
+        back_populates="lead_base", cascade="all, delete-orphan",
+        order_by="RoutingRule.prioridad",
     )
@@ -1,30 +1,53 @@
+import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
 
 
+class LoteStatus(str, enum.Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class Lote(Base):
     __tablename__ = "lotes"
+    __table_args__ = (
+        Index("ix_lotes_cuenta_created", "cuenta_id", text("created_at DESC")),
+        CheckConstraint(
+            "estado IN (" + ", ".join(f"'{s.value}'" for s in LoteStatus) + ")",
+            name="ck_lotes_estado",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     lead_base_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("lead_bases.id", ondelete="SET NULL"),
         nullable=True, index=True,
     )
+    # Written once, at the end of the import (leads never change lote after
+    # that), so there is no per-lead counter UPDATE to contend on.
     total_leads: Mapped[int] = mapped_column(Integer, default=0)
+    # Imports are accepted as pending and finished by a background task; the
+    # server default only covers lotes imported before that (migration 040)
+    estado: Mapped[str] = mapped_column(
+        String(20), nullable=False,
+        default=LoteStatus.PENDING.value, server_default=LoteStatus.COMPLETED.value,
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     account: Mapped["Account"] = relationship(back_populates="lotes")  # noqa: F821
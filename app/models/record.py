@@ -1,28 +1,58 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Record(Base):
     __tablename__ = "records"
+    __table_args__ = (
+        Index(
+            "ix_records_datos_gin", "datos",
+            postgresql_using="gin", postgresql_ops={"datos": "jsonb_path_ops"},
+        ),
+        Index("ix_records_cuenta_created", "cuenta_id", text("created_at DESC")),
+        Index(
+            "ix_records_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_records_cuenta_email", "cuenta_id", "email",
+            postgresql_where=text("email IS NOT NULL"),
+        ),
+        Index(
+            "ix_records_cuenta_telefono", "cuenta_id", "telefono",
+            postgresql_where=text("telefono IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     datos: Mapped[dict] = mapped_column(JSONB, nullable=False)
     metadata_: Mapped[dict | None] = mapped_column(
         "metadata", JSONB, nullable=True
     )
+    # Hot contact keys, generated by Postgres from datos (read-only)
+    email: Mapped[str | None] = mapped_column(
+        Text, Computed("lower(datos->>'email')", persisted=True)
+    )
+    telefono: Mapped[str | None] = mapped_column(
+        Text, Computed("COALESCE(datos->>'telefono', datos->>'phone')", persisted=True)
+    )
+    nombre: Mapped[str | None] = mapped_column(
+        Text, Computed("datos->>'nombre'", persisted=True)
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     account: Mapped["Account"] = relationship(back_populates="records")  # noqa: F821
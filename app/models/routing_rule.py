@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,12 +10,16 @@ from app.core.database import Base
 
 class RoutingRule(Base):
     __tablename__ = "routing_rules"
+    __table_args__ = (
+        Index("ix_routing_rules_lb_prio", "lead_base_id", "prioridad"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     lead_base_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("lead_bases.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("lead_bases.id", ondelete="CASCADE")
     )
     campo: Mapped[str] = mapped_column(String(255), nullable=False)
     operador: Mapped[str] = mapped_column(String(20), nullable=False)
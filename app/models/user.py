@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,15 +11,17 @@ from app.core.database import Base
 class User(Base):
     __tablename__ = "users"
     __table_args__ = (
-        UniqueConstraint("cuenta_id", "email", name="uq_account_user_email"),
+        Index("ix_users_email_lower", "cuenta_id", func.lower(text("email")), unique=True),
         UniqueConstraint("cuenta_id", "username", name="uq_account_username"),
+        Index("ix_users_cuenta_id_active", "cuenta_id", postgresql_where=text("activo IS TRUE")),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
+        UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE")
     )
     role_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("roles.id", ondelete="SET NULL"),
@@ -40,3 +42,7 @@ class User(Base):
 
     account: Mapped["Account"] = relationship(back_populates="users")  # noqa: F821
     role: Mapped["Role | None"] = relationship(back_populates="users")  # noqa: F821
+
+    @property
+    def role_nombre(self) -> str | None:
+        return self.role.nombre if self.role else None
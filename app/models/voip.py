@@ -16,13 +16,14 @@ import uuid
 from datetime import datetime, time
 
 from sqlalchemy import (
-    Boolean, DateTime, Enum, Float, ForeignKey, Integer,
-    String, Text, Time, UniqueConstraint, func,
+    Boolean, CheckConstraint, DateTime, Enum, Float, ForeignKey, Index, Integer,
+    String, Text, Time, UniqueConstraint, func, text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -77,6 +78,16 @@ class CallResult(str, enum.Enum):
     TIMEOUT = "timeout"
 
 
+TRANSPORTS = ("udp", "tcp", "tls")
+CALL_DIRECTIONS = ("outbound", "inbound")
+
+
+def _check_in(column: str, values, name: str) -> CheckConstraint:
+    """CHECK (<column> IN (...)) for a str-valued state column (migration 035)."""
+    allowed = ", ".join(f"'{getattr(v, 'value', v)}'" for v in values)
+    return CheckConstraint(f"{column} IN ({allowed})", name=name)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # SIP Provider  (carrier / empresa de telefonía)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -84,7 +95,7 @@ class CallResult(str, enum.Enum):
 class SipProvider(Base):
     __tablename__ = "sip_providers"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     pais: Mapped[str | None] = mapped_column(String(10), nullable=True)
@@ -102,8 +113,11 @@ class SipProvider(Base):
 
 class SipTrunk(Base):
     __tablename__ = "sip_trunks"
+    __table_args__ = (
+        _check_in("transport", TRANSPORTS, "ck_sip_trunks_transport"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
     provider_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("sip_providers.id", ondelete="CASCADE"), index=True)
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -135,7 +149,7 @@ class SipTrunk(Base):
 class PbxNode(Base):
     __tablename__ = "pbx_nodes"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     host: Mapped[str] = mapped_column(String(255), nullable=False, comment="Asterisk IP/hostname")
@@ -159,11 +173,14 @@ class PbxNode(Base):
 
 class Agent(Base):
     __tablename__ = "agents"
+    __table_args__ = (
+        _check_in("estado", AgentStatus, "ck_agents_estado"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
     user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    pbx_node_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("pbx_nodes.id", ondelete="SET NULL"), nullable=True)
+    pbx_node_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("pbx_nodes.id", ondelete="SET NULL"), nullable=True, index=True)
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     # SIP extension
     extension: Mapped[str] = mapped_column(String(20), nullable=False, comment="SIP extension number (e.g. 1001)")
@@ -194,7 +211,7 @@ class Disposition(Base):
         UniqueConstraint("cuenta_id", "codigo", name="uq_account_disposition_code"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
     codigo: Mapped[str] = mapped_column(String(50), nullable=False, comment="e.g. VENTA, NO_INTERESADO, RELLAMAR")
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -213,11 +230,15 @@ class Disposition(Base):
 
 class Campaign(Base):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        _check_in("estado", CampaignStatus, "ck_campaigns_estado"),
+        _check_in("dialer_mode", DialerMode, "ck_campaigns_dialer_mode"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
-    trunk_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("sip_trunks.id", ondelete="SET NULL"), nullable=True)
-    pbx_node_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("pbx_nodes.id", ondelete="SET NULL"), nullable=True)
+    trunk_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("sip_trunks.id", ondelete="SET NULL"), nullable=True, index=True)
+    pbx_node_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("pbx_nodes.id", ondelete="SET NULL"), nullable=True, index=True)
     nombre: Mapped[str] = mapped_column(String(255), nullable=False)
     descripcion: Mapped[str | None] = mapped_column(Text, nullable=True)
     # Dialer
@@ -263,7 +284,7 @@ class CampaignAgent(Base):
         UniqueConstraint("campaign_id", "agent_id", name="uq_campaign_agent"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
     campaign_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="CASCADE"), index=True)
     agent_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("agents.id", ondelete="CASCADE"), index=True)
     prioridad: Mapped[int] = mapped_column(Integer, default=0)
@@ -281,23 +302,25 @@ class CampaignLead(Base):
     __tablename__ = "campaign_leads"
     __table_args__ = (
         UniqueConstraint("campaign_id", "lead_id", name="uq_campaign_lead"),
+        Index("ix_campaign_leads_campaign_estado_next", "campaign_id", "estado", "proximo_intento"),
+        _check_in("estado", CampaignLeadStatus, "ck_campaign_leads_estado"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    campaign_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="CASCADE"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
+    campaign_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="CASCADE"))
     lead_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), index=True)
     telefono: Mapped[str] = mapped_column(String(50), nullable=False, comment="Phone to dial")
     # Dial state
-    estado: Mapped[str] = mapped_column(String(20), default=CampaignLeadStatus.PENDING.value, index=True)
+    estado: Mapped[str] = mapped_column(String(20), default=CampaignLeadStatus.PENDING.value)
     intentos: Mapped[int] = mapped_column(Integer, default=0)
     ultimo_intento: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     proximo_intento: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
     # Disposition
-    disposition_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("dispositions.id", ondelete="SET NULL"), nullable=True)
+    disposition_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("dispositions.id", ondelete="SET NULL"), nullable=True, index=True)
     disposition_nota: Mapped[str | None] = mapped_column(Text, nullable=True)
     # Scheduling
     callback_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    assigned_agent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("agents.id", ondelete="SET NULL"), nullable=True)
+    assigned_agent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("agents.id", ondelete="SET NULL"), nullable=True, index=True)
     #
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -314,13 +337,19 @@ class CampaignLead(Base):
 
 class CallRecord(Base):
     __tablename__ = "call_records"
+    __table_args__ = (
+        Index("ix_call_records_cuenta_created", "cuenta_id", text("created_at DESC")),
+        Index("ix_call_records_campaign_created", "campaign_id", text("created_at DESC")),
+        _check_in("resultado", ["pending", *CallResult], "ck_call_records_resultado"),
+        _check_in("direccion", CALL_DIRECTIONS, "ck_call_records_direccion"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
-    campaign_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="SET NULL"), nullable=True, index=True)
-    campaign_lead_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("campaign_leads.id", ondelete="SET NULL"), nullable=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"))
+    campaign_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("campaigns.id", ondelete="SET NULL"), nullable=True)
+    campaign_lead_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("campaign_leads.id", ondelete="SET NULL"), nullable=True, index=True)
     agent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("agents.id", ondelete="SET NULL"), nullable=True, index=True)
-    trunk_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("sip_trunks.id", ondelete="SET NULL"), nullable=True)
+    trunk_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("sip_trunks.id", ondelete="SET NULL"), nullable=True, index=True)
     # Call info
     uniqueid: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True, comment="Asterisk Uniqueid")
     linkedid: Mapped[str | None] = mapped_column(String(100), nullable=True, comment="Asterisk Linkedid for bridged calls")
@@ -339,7 +368,7 @@ class CallRecord(Base):
     hangup_cause: Mapped[int | None] = mapped_column(Integer, nullable=True, comment="SIP/Asterisk hangup cause code")
     hangup_cause_text: Mapped[str | None] = mapped_column(String(100), nullable=True)
     # Disposition
-    disposition_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("dispositions.id", ondelete="SET NULL"), nullable=True)
+    disposition_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("dispositions.id", ondelete="SET NULL"), nullable=True, index=True)
     disposition_nota: Mapped[str | None] = mapped_column(Text, nullable=True)
     # Recording
     recording_path: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -362,10 +391,16 @@ class CallRecord(Base):
 # ═══════════════════════════════════════════════════════════════════════════
 
 class CallEvent(Base):
+    """Partitioned by month on timestamp (migration 032); the table's primary
+    key is (id, timestamp), id alone is enough for the ORM identity."""
+
     __tablename__ = "call_events"
+    __table_args__ = (
+        Index("ix_call_events_call_record_id_timestamp", "call_record_id", "timestamp"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    call_record_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("call_records.id", ondelete="CASCADE"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    call_record_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("call_records.id", ondelete="CASCADE"))
     evento: Mapped[str] = mapped_column(String(50), nullable=False, comment="originate/ringing/answered/bridged/hangup/recording_ready/disposition")
     detalle: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -381,11 +416,12 @@ class DncEntry(Base):
     __tablename__ = "dnc_entries"
     __table_args__ = (
         UniqueConstraint("cuenta_id", "telefono", name="uq_account_dnc_phone"),
+        Index("ix_dnc_entries_cuenta_tel_digits", "cuenta_id", text("regexp_replace(telefono, '\\D', '', 'g')")),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True)
-    telefono: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid())
+    cuenta_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"))
+    telefono: Mapped[str] = mapped_column(String(50), nullable=False)
     motivo: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
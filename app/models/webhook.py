@@ -1,20 +1,33 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class Webhook(Base):
     """Outbound webhook: when an event fires in the system, POST to this URL."""
 
     __tablename__ = "webhooks"
+    __table_args__ = (
+        Index(
+            "ix_webhooks_eventos_gin", "eventos",
+            postgresql_using="gin", postgresql_ops={"eventos": "jsonb_path_ops"},
+            postgresql_where=text("activo IS TRUE"),
+        ),
+        Index(
+            "ix_webhooks_cuenta_id_active", "cuenta_id",
+            postgresql_where=text("activo IS TRUE"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        server_default=func.gen_random_uuid(),
     )
     cuenta_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), index=True
@@ -47,12 +60,22 @@ class Webhook(Base):
 
 
 class WebhookLog(Base):
-    """Delivery attempt log for a webhook call."""
+    """Delivery attempt log for a webhook call.
+
+    Partitioned by month on created_at (migration 018); the table's primary
+    key is (id, created_at), id alone is enough for the ORM identity.
+    """
 
     __tablename__ = "webhook_logs"
+    __table_args__ = (
+        Index(
+            "ix_webhook_logs_created_at_brin", "created_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     webhook_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("webhooks.id", ondelete="CASCADE"), index=True
@@ -64,7 +87,7 @@ class WebhookLog(Base):
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     webhook: Mapped["Webhook"] = relationship(back_populates="logs")
@@ -29,4 +29,4 @@ class AccountResponse(BaseModel):
 
 class AccountListResponse(BaseModel):
     items: list[AccountResponse]
-    total: int
+    next_cursor: str | None = None
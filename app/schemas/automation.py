@@ -1,12 +1,17 @@
 import uuid
 from datetime import datetime
+from typing import Literal, get_args
 
 from pydantic import BaseModel, ConfigDict
 
 
 # ── Trigger / action type constants ────────────────────────────────────────
 
-TRIGGER_TYPES = [
+# Request schemas type these fields with the Literal aliases, so pydantic
+# rejects unknown values (422) before the endpoint runs; the lists are
+# what /automation-meta advertises.
+
+TriggerType = Literal[
     "lead_created",
     "lead_updated",
     "lead_moved",
@@ -14,14 +19,14 @@ TRIGGER_TYPES = [
     "lote_imported",
 ]
 
-ACTION_TYPES = [
+ActionType = Literal[
     "webhook",
     "move_to_base",
     "update_field",
     "send_notification",
 ]
 
-CONDITION_OPERATORS = [
+ConditionOperator = Literal[
     "equals",
     "not_equals",
     "contains",
@@ -32,12 +37,16 @@ CONDITION_OPERATORS = [
     "is_not_empty",
 ]
 
+TRIGGER_TYPES = list(get_args(TriggerType))
+ACTION_TYPES = list(get_args(ActionType))
+CONDITION_OPERATORS = list(get_args(ConditionOperator))
+
 
 # ── Condition ──────────────────────────────────────────────────────────────
 
 class ConditionCreate(BaseModel):
     campo: str
-    operador: str
+    operador: ConditionOperator
     valor: str = ""
     orden: int = 0
 
@@ -55,7 +64,7 @@ class ConditionResponse(BaseModel):
 # ── Action ─────────────────────────────────────────────────────────────────
 
 class ActionCreate(BaseModel):
-    tipo: str
+    tipo: ActionType
     config: dict = {}
     orden: int = 0
 
@@ -74,7 +83,7 @@ class ActionResponse(BaseModel):
 class AutomationCreate(BaseModel):
     nombre: str
     descripcion: str | None = None
-    trigger_tipo: str
+    trigger_tipo: TriggerType
     trigger_config: dict | None = None
     activo: bool = True
     conditions: list[ConditionCreate] = []
@@ -84,7 +93,7 @@ class AutomationCreate(BaseModel):
 class AutomationUpdate(BaseModel):
     nombre: str | None = None
     descripcion: str | None = None
-    trigger_tipo: str | None = None
+    trigger_tipo: TriggerType | None = None
     trigger_config: dict | None = None
     activo: bool | None = None
 
@@ -127,7 +136,7 @@ class AutomationLogResponse(BaseModel):
 
 class AutomationLogListResponse(BaseModel):
     items: list[AutomationLogResponse]
-    total: int
+    next_cursor: str | None = None
 
 
 # ── Meta ───────────────────────────────────────────────────────────────────
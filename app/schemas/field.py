@@ -33,4 +33,4 @@ class FieldResponse(BaseModel):
 
 class FieldListResponse(BaseModel):
     items: list[FieldResponse]
-    total: int
+    next_cursor: str | None = None
@@ -1,8 +1,12 @@
 import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
 
+# Checked by pydantic at parse time (422 on anything else)
+RoutingOperator = Literal["equals", "not_equals", "contains", "greater_than", "less_than"]
+
 
 class LeadBaseCreate(BaseModel):
     nombre: str
@@ -32,14 +36,14 @@ class LeadBaseListResponse(BaseModel):
 
 class RoutingRuleCreate(BaseModel):
     campo: str
-    operador: str
+    operador: RoutingOperator
     valor: str
     prioridad: int = 0
 
 
 class RoutingRuleUpdate(BaseModel):
     campo: str | None = None
-    operador: str | None = None
+    operador: RoutingOperator | None = None
     valor: str | None = None
     prioridad: int | None = None
 
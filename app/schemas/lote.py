@@ -13,6 +13,7 @@ class LoteResponse(BaseModel):
     lead_base_id: uuid.UUID | None = None
     base_nombre: str | None = None
     total_leads: int
+    estado: str
     created_at: datetime
 
 
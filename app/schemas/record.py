@@ -12,6 +12,9 @@ class RecordResponse(BaseModel):
     cuenta_id: uuid.UUID
     datos: dict[str, Any]
     metadata_: dict[str, Any] | None
+    email: str | None = None
+    telefono: str | None = None
+    nombre: str | None = None
     created_at: datetime
 
 
@@ -2,10 +2,17 @@
 
 import uuid
 from datetime import datetime, time
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict
 
+from app.models.voip import TRANSPORTS, DialerMode
+
+# Value sets of the ck_sip_trunks_transport / ck_campaigns_dialer_mode CHECKs,
+# validated here so a bad value is a 422 rather than an IntegrityError
+Transport = Literal[TRANSPORTS]
+DialerModeValue = Literal[tuple(m.value for m in DialerMode)]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SIP Provider
@@ -48,7 +55,7 @@ class SipTrunkCreate(BaseModel):
     port: int = 5060
     username: str | None = None
     password: str | None = None
-    transport: str = "udp"
+    transport: Transport = "udp"
     codecs: str = "ulaw,alaw,g729"
     caller_id: str | None = None
     max_concurrent: int = 30
@@ -62,7 +69,7 @@ class SipTrunkUpdate(BaseModel):
     port: int | None = None
     username: str | None = None
     password: str | None = None
-    transport: str | None = None
+    transport: Transport | None = None
     codecs: str | None = None
     caller_id: str | None = None
     max_concurrent: int | None = None
@@ -234,7 +241,7 @@ class CampaignCreate(BaseModel):
     descripcion: str | None = None
     trunk_id: uuid.UUID | None = None
     pbx_node_id: uuid.UUID | None = None
-    dialer_mode: str = "manual"
+    dialer_mode: DialerModeValue = "manual"
     caller_id: str | None = None
     hora_inicio: time | None = None
     hora_fin: time | None = None
@@ -252,7 +259,7 @@ class CampaignUpdate(BaseModel):
     descripcion: str | None = None
     trunk_id: uuid.UUID | None = None
     pbx_node_id: uuid.UUID | None = None
-    dialer_mode: str | None = None
+    dialer_mode: DialerModeValue | None = None
     caller_id: str | None = None
     hora_inicio: time | None = None
     hora_fin: time | None = None
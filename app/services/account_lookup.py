@@ -0,0 +1,24 @@
+"""
+Account existence check shared by the admin endpoints.
+
+Most handlers only need to 404 on an unknown account_id before doing their
+real work; known ids are remembered per worker so the common case skips the
+extra round-trip.
+"""
+
+import uuid
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.caching import account_exists_cache
+from app.models.account import Account
+
+
+def assert_account_exists(db: Session, account_id: uuid.UUID) -> None:
+    """Raise 404 unless the account exists (active or soft-deleted)."""
+    if account_exists_cache.get(account_id):
+        return
+    if db.query(Account.id).filter(Account.id == account_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    account_exists_cache.set(account_id, True)
@@ -17,6 +17,7 @@ from typing import Any
 import httpx
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.caching import lead_counts_cache
 from app.models.automation import Automation, AutomationAction, AutomationCondition, AutomationLog
 from app.models.lead import Lead
 from app.models.lead_base import LeadBase
@@ -212,6 +213,7 @@ def _action_move_to_base(db: Session, config: dict, lead: Lead | None) -> dict:
 
     lead.lead_base_id = base.id
     db.flush()
+    lead_counts_cache.pop(lead.cuenta_id)
     return {"success": True, "detail": f"Moved to base '{base.nombre}'"}
 
 
@@ -12,6 +12,7 @@ periodically by a scheduler (e.g., Celery beat, APScheduler, or cron).
 """
 
 import logging
+import re
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -26,6 +27,8 @@ from app.services.ami_manager import OriginateResult, ami_manager
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGITS = re.compile(r"\D")
+
 
 def manual_call(
     db: Session,
@@ -58,11 +61,7 @@ def manual_call(
         return OriginateResult(success=False, message="Campaign not found")
 
     # Check DNC
-    is_dnc = db.query(DncEntry).filter(
-        DncEntry.cuenta_id == cuenta_id,
-        DncEntry.telefono == cl.telefono,
-    ).first()
-    if is_dnc:
+    if is_dnc(db, cuenta_id, cl.telefono):
         cl.estado = CampaignLeadStatus.DNC.value
         db.commit()
         return OriginateResult(success=False, message="Number is on DNC list")
@@ -152,6 +151,25 @@ def get_available_agents(db: Session, campaign_id: uuid.UUID) -> list[Agent]:
     )
 
 
+def phone_digits(telefono: str) -> str:
+    """Digits of a phone number, the form DNC entries are matched on."""
+    return _NON_DIGITS.sub("", telefono)
+
+
+def is_dnc(db: Session, cuenta_id: uuid.UUID, telefono: str) -> bool:
+    """
+    DNC check on digits only, so "+54 11 5555-0000" matches "541155550000".
+    The expression mirrors ix_dnc_entries_cuenta_tel_digits.
+    """
+    digits = phone_digits(telefono)
+    return db.query(
+        db.query(DncEntry.id).filter(
+            DncEntry.cuenta_id == cuenta_id,
+            func.regexp_replace(DncEntry.telefono, r"\D", "", "g") == digits,
+        ).exists()
+    ).scalar()
+
+
 def get_active_calls_count(db: Session, campaign_id: uuid.UUID) -> int:
     """Count currently dialing/active calls for a campaign."""
     return (
@@ -212,11 +230,7 @@ def run_progressive_dialer(db: Session, campaign: Campaign) -> list[OriginateRes
             break
 
         # Check DNC
-        is_dnc = db.query(DncEntry).filter(
-            DncEntry.cuenta_id == campaign.cuenta_id,
-            DncEntry.telefono == lead.telefono,
-        ).first()
-        if is_dnc:
+        if is_dnc(db, campaign.cuenta_id, lead.telefono):
             lead.estado = CampaignLeadStatus.DNC.value
             db.commit()
             continue
@@ -266,11 +280,7 @@ def run_predictive_dialer(db: Session, campaign: Campaign) -> list[OriginateResu
             break
 
         # Check DNC
-        is_dnc = db.query(DncEntry).filter(
-            DncEntry.cuenta_id == campaign.cuenta_id,
-            DncEntry.telefono == lead.telefono,
-        ).first()
-        if is_dnc:
+        if is_dnc(db, campaign.cuenta_id, lead.telefono):
             lead.estado = CampaignLeadStatus.DNC.value
             db.commit()
             continue
@@ -1,63 +1,83 @@
 import logging
 import uuid
+from collections.abc import Set
 from typing import Any
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.core.caching import field_names_cache
 from app.core.config import settings
 from app.models.field import CustomField
 from app.services.type_inference import infer_type
 
 logger = logging.getLogger(__name__)
 
+_EXCLUDED_FIELDS = frozenset(settings.EXCLUDED_FIELDS)
+
+
+def get_account_field_names(db: Session, cuenta_id: uuid.UUID) -> frozenset[str]:
+    """Registered field names of an account, cached for a few seconds.
+
+    Field writes pop the entry; other workers may see a stale set until the
+    TTL expires, which auto_create_fields tolerates (ON CONFLICT DO NOTHING).
+    """
+    names = field_names_cache.get(cuenta_id)
+    if names is None:
+        names = frozenset(
+            db.execute(
+                select(CustomField.nombre_campo).where(CustomField.cuenta_id == cuenta_id)
+            ).scalars()
+        )
+        field_names_cache.set(cuenta_id, names)
+    return names
+
 
 def auto_create_fields(
     db: Session,
     cuenta_id: uuid.UUID,
     payload: dict[str, Any],
-    existing_field_names: set[str],
+    existing_field_names: Set[str],
 ) -> list[str]:
     """Auto-create fields for keys not yet registered. Returns list of created field names."""
-    created: list[str] = []
-
-    for key, value in payload.items():
-        if key in settings.EXCLUDED_FIELDS:
-            logger.debug("Skipping excluded field: %s", key)
-            continue
-
-        if key in existing_field_names:
-            continue
-
-        tipo = infer_type(value)
-        field = CustomField(
-            cuenta_id=cuenta_id,
-            nombre_campo=key,
-            tipo_dato=tipo,
-        )
-        db.add(field)
-        created.append(key)
-        logger.info(
-            "Auto-created field '%s' (type=%s) for account %s",
-            key,
-            tipo,
-            cuenta_id,
-        )
+    rows = [
+        {"cuenta_id": cuenta_id, "nombre_campo": key, "tipo_dato": infer_type(value)}
+        for key, value in payload.items()
+        if key not in _EXCLUDED_FIELDS and key not in existing_field_names
+    ]
+    if not rows:
+        return []
 
-    if created:
-        db.flush()
+    # A concurrent request (or a stale cached name set) may have registered
+    # the same name already; skip those rather than failing the whole ingest.
+    created = list(
+        db.execute(
+            pg_insert(CustomField)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_account_field_name")
+            .returning(CustomField.nombre_campo)
+        ).scalars()
+    )
+    field_names_cache.pop(cuenta_id)
 
+    for row in rows:
+        if row["nombre_campo"] in created:
+            logger.info(
+                "Auto-created field '%s' (type=%s) for account %s",
+                row["nombre_campo"],
+                row["tipo_dato"],
+                cuenta_id,
+            )
     return created
 
 
 def detect_unknown_fields(
     payload: dict[str, Any],
-    existing_field_names: set[str],
+    existing_field_names: Set[str],
 ) -> list[str]:
     """Return field names present in the payload but not registered for the account."""
-    unknown = []
-    for key in payload:
-        if key in settings.EXCLUDED_FIELDS:
-            continue
-        if key not in existing_field_names:
-            unknown.append(key)
-    return unknown
+    return [
+        key for key in payload
+        if key not in _EXCLUDED_FIELDS and key not in existing_field_names
+    ]
@@ -1,21 +1,50 @@
 """
-Generates the next sequential id_lead for a given account.
-Each account has its own independent counter starting at 1.
+Generates the next sequential id_lead for a given account, or reserves a
+block of them for bulk imports. Each account has its own independent
+counter starting at 1.
+
+Counters live in `lead_counters` and are advanced with a single
+UPDATE ... RETURNING, which only row-locks the account's counter until the
+surrounding transaction commits (no MAX() scan over leads, no duplicates
+under concurrent inserts).
 """
 
 import uuid
 
-from sqlalchemy import func
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.models.lead import Lead
+from app.models.lead import Lead, LeadCounter
 
 
 def next_id_lead(db: Session, cuenta_id: uuid.UUID) -> int:
     """Return the next available id_lead for the account."""
+    return reserve_id_leads(db, cuenta_id, 1)
+
+
+def reserve_id_leads(db: Session, cuenta_id: uuid.UUID, count: int) -> int:
+    """Reserve ``count`` consecutive id_leads for the account and return the
+    first one; the block is ``first .. first + count - 1``."""
+    next_id = db.execute(
+        update(LeadCounter)
+        .where(LeadCounter.cuenta_id == cuenta_id)
+        .values(next_id=LeadCounter.next_id + count)
+        .returning(LeadCounter.next_id - count)
+    ).scalar()
+    if next_id is not None:
+        return next_id
+
+    # First lead for this account since counters were introduced: seed the
+    # counter from the existing leads. ON CONFLICT covers a concurrent seed.
     max_id = (
-        db.query(func.max(Lead.id_lead))
-        .filter(Lead.cuenta_id == cuenta_id)
-        .scalar()
+        select(func.coalesce(func.max(Lead.id_lead), 0))
+        .where(Lead.cuenta_id == cuenta_id)
+        .scalar_subquery()
     )
-    return (max_id or 0) + 1
+    stmt = insert(LeadCounter).values(cuenta_id=cuenta_id, next_id=max_id + 1 + count)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LeadCounter.cuenta_id],
+        set_={"next_id": LeadCounter.next_id + count},
+    ).returning(LeadCounter.next_id - count)
+    return db.execute(stmt).scalar_one()
@@ -0,0 +1,96 @@
+"""
+Keeps monthly partitions of the append-only log tables ahead of time.
+
+`webhook_logs` and `automation_logs` are partitioned by RANGE (created_at)
+since migration 018, `call_events` by RANGE (timestamp) since 032. Rows for
+a month without its own partition end up in the `<table>_default` partition,
+so this only needs to run now and then (it is called on startup) to keep the
+current and upcoming months split out; rows that already landed in the
+default are moved into the new partition.
+
+Retention is a metadata operation instead of a DELETE:
+    ALTER TABLE webhook_logs DETACH PARTITION webhook_logs_2025_12;
+    DROP TABLE webhook_logs_2025_12;
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_LOG_TABLES = ("webhook_logs", "automation_logs", "call_events")
+
+# Partition key of each table, used to move rows out of a default partition
+_PARTITION_KEYS = {
+    "webhook_logs": "created_at",
+    "automation_logs": "created_at",
+    "call_events": '"timestamp"',
+}
+
+
+def _add_months(d: date, months: int) -> date:
+    month_index = d.month - 1 + months
+    return date(d.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_partition(conn: Connection, table: str, partition: str, start: date, end: date) -> None:
+    if conn.execute(text("SELECT to_regclass(:p)"), {"p": partition}).scalar():
+        return
+
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    key = _PARTITION_KEYS.get(table)
+    has_rows = key and conn.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {table}_default "
+        f"WHERE {key} >= :start AND {key} < :end)"
+    ), {"start": start, "end": end}).scalar()
+
+    if not has_rows:
+        conn.execute(text(f"CREATE TABLE {partition} PARTITION OF {table} {bounds}"))
+        return
+
+    # The default already holds rows for this month, which makes a plain
+    # CREATE ... PARTITION OF fail. Take the default out, move the rows into
+    # the new partition and put it back (writes to the table wait meanwhile).
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {table}_default"))
+    conn.execute(text(f"CREATE TABLE {partition} PARTITION OF {table} {bounds}"))
+    conn.execute(text(
+        f"WITH moved AS (DELETE FROM {table}_default "
+        f"WHERE {key} >= :start AND {key} < :end RETURNING *) "
+        f"INSERT INTO {partition} SELECT * FROM moved"
+    ), {"start": start, "end": end})
+    conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {table}_default DEFAULT"))
+    logger.info("Moved rows of %s out of %s_default", partition, table)
+
+
+def ensure_log_partitions(conn: Connection, months_ahead: int = 2) -> None:
+    """Create the partitions for the current month and the next `months_ahead`.
+
+    Each partition is committed on its own, so one that fails (and is
+    logged) doesn't hold back the rest.
+    """
+    first = date.today().replace(day=1)
+
+    for table in PARTITIONED_LOG_TABLES:
+        # Skip tables created by create_all() as plain (non-partitioned) tables
+        is_partitioned = conn.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:t)"),
+            {"t": table},
+        ).scalar()
+        if not is_partitioned:
+            continue
+
+        for i in range(months_ahead + 1):
+            start = _add_months(first, i)
+            end = _add_months(first, i + 1)
+            partition = f"{table}_{start:%Y_%m}"
+            try:
+                _create_partition(conn, table, partition, start, end)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error("Failed to create partition %s: %s", partition, e)
+                continue
+            logger.debug("Partition %s verified", partition)
@@ -2,6 +2,8 @@ import logging
 import uuid
 from typing import Any
 
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, subqueryload
 
 from app.models.lead_base import LeadBase
@@ -13,23 +15,22 @@ VALID_OPERATORS = {"equals", "not_equals", "contains", "greater_than", "less_tha
 
 def _get_or_create_default_base(db: Session, cuenta_id: uuid.UUID) -> LeadBase:
     """Get the default base for an account, creating one if it doesn't exist."""
-    default_base = (
-        db.query(LeadBase)
-        .filter(LeadBase.cuenta_id == cuenta_id, LeadBase.es_default.is_(True))
-        .first()
-    )
+    default_filter = (LeadBase.cuenta_id == cuenta_id, LeadBase.es_default.is_(True))
+    default_base = db.query(LeadBase).filter(*default_filter).first()
     if default_base:
         return default_base
 
-    default_base = LeadBase(
-        cuenta_id=cuenta_id,
-        nombre="Default",
-        es_default=True,
-    )
-    db.add(default_base)
-    db.flush()
-    logger.info("Auto-created default base for account %s", cuenta_id)
-    return default_base
+    # Concurrent first ingests race to create it; uq_lead_bases_default_per_account
+    # lets exactly one insert land and the others pick that row up.
+    created = db.execute(
+        pg_insert(LeadBase)
+        .values(cuenta_id=cuenta_id, nombre="Default", es_default=True)
+        .on_conflict_do_nothing(index_elements=["cuenta_id"], index_where=text("es_default IS TRUE"))
+        .returning(LeadBase.id)
+    ).scalar_one_or_none()
+    if created:
+        logger.info("Auto-created default base for account %s", cuenta_id)
+    return db.query(LeadBase).filter(*default_filter).one()
 
 
 def evaluate_routing(db: Session, cuenta_id: uuid.UUID, payload: dict[str, Any]) -> uuid.UUID:
@@ -50,9 +51,10 @@ def evaluate_routing(db: Session, cuenta_id: uuid.UUID, payload: dict[str, Any])
         else:
             non_default_bases.append(base)
 
-    # Sort by minimum priority of rules (lower = higher priority)
+    # Sort by minimum priority of rules (lower = higher priority); rules are
+    # loaded ordered by prioridad, so the first one holds the minimum
     non_default_bases.sort(
-        key=lambda b: min((r.prioridad for r in b.routing_rules), default=999999)
+        key=lambda b: b.routing_rules[0].prioridad if b.routing_rules else 999999
     )
 
     for base in non_default_bases:
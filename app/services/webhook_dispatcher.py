@@ -38,14 +38,15 @@ def dispatch_event(
     """Send `payload` to every active webhook of the account that listens to `evento`."""
     webhooks = (
         db.query(Webhook)
-        .filter(Webhook.cuenta_id == cuenta_id, Webhook.activo.is_(True))
+        .filter(
+            Webhook.cuenta_id == cuenta_id,
+            Webhook.activo.is_(True),
+            Webhook.eventos.contains([evento]),
+        )
         .all()
     )
 
     for wh in webhooks:
-        if evento not in (wh.eventos or []):
-            continue
-
         _deliver(db, wh, evento, payload)
 
 
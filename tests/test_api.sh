@@ -9,6 +9,8 @@
 # Variables de entorno opcionales:
 #   BASE_URL    (default: http://localhost:8000)
 #   ADMIN_KEY   (default: vacio, asume AUTH_ENABLED=false)
+#
+# El paso de lotes genera el Excel con python3 + openpyxl.
 # =============================================================================
 
 set -euo pipefail
@@ -229,32 +231,86 @@ LEADS_TOTAL=$(extract_json "$BODY" "total")
 echo "    Total leads: $LEADS_TOTAL (esperado >= 2)"
 echo ""
 
-# --- 18. Lead no encontrado --------------------------------------------------
-echo "[18] Lead no encontrado (404)"
+# --- 18. Importar lote (Excel) ---------------------------------------------
+echo "[18] Importar lote desde Excel (202, estado pending)"
+LOTE_XLSX=$(mktemp --suffix=.xlsx)
+python3 -c "
+import sys
+from openpyxl import Workbook
+wb = Workbook()
+ws = wb.active
+ws.append(['nombre', 'email'])
+ws.append(['Lote Uno', 'uno@example.com'])
+ws.append(['Lote Dos', 'dos@example.com'])
+ws.append(['Lote Tres', 'tres@example.com'])
+wb.save(sys.argv[1])
+" "$LOTE_XLSX"
+parse_response "$(curl -s -w "\n%{http_code}" -X POST \
+  "$BASE_URL/api/v1/admin/accounts/$ACCOUNT_ID/lotes/import" \
+  -H "$(auth_header)" \
+  -F "nombre=Lote de prueba" \
+  -F "file=@$LOTE_XLSX")"
+rm -f "$LOTE_XLSX"
+check "POST /admin/accounts/{id}/lotes/import" 202 "$CODE" "$BODY"
+
+LOTE_ID=$(extract_json "$BODY" "id")
+LOTE_ESTADO=$(extract_json "$BODY" "estado")
+echo "    Lote ID: $LOTE_ID"
+if [ "$LOTE_ESTADO" = "pending" ]; then
+  echo "  PASS  lote aceptado como pending"
+  PASS=$((PASS + 1))
+else
+  echo "  FAIL  estado del lote: '$LOTE_ESTADO' (esperado pending)"
+  FAIL=$((FAIL + 1))
+fi
+echo ""
+
+# --- 19. Esperar fin de la importacion --------------------------------------
+echo "[19] Polling GET /lotes/{id} hasta estado completed"
+LOTE_ESTADO=""
+for _ in $(seq 1 30); do
+  parse_response "$(do_request GET "$BASE_URL/api/v1/admin/lotes/$LOTE_ID")"
+  LOTE_ESTADO=$(extract_json "$BODY" "estado")
+  [ "$LOTE_ESTADO" = "pending" ] || break
+  sleep 1
+done
+LOTE_TOTAL=$(extract_json "$BODY" "total_leads")
+if [ "$LOTE_ESTADO" = "completed" ] && [ "$LOTE_TOTAL" = "3" ]; then
+  echo "  PASS  lote completed con $LOTE_TOTAL leads"
+  PASS=$((PASS + 1))
+else
+  echo "  FAIL  lote en estado '$LOTE_ESTADO' con total_leads '$LOTE_TOTAL' (esperado completed / 3)"
+  echo "        Body: $BODY"
+  FAIL=$((FAIL + 1))
+fi
+echo ""
+
+# --- 20. Lead no encontrado --------------------------------------------------
+echo "[20] Lead no encontrado (404)"
 parse_response "$(do_request GET "$BASE_URL/api/v1/admin/leads/00000000-0000-0000-0000-000000000000")"
 check "GET /admin/leads/{id} inexistente" 404 "$CODE" "$BODY"
 echo ""
 
-# --- 19. Ingest con api_key invalida ----------------------------------------
-echo "[19] Ingest con api_key invalida (404)"
+# --- 21. Ingest con api_key invalida ----------------------------------------
+echo "[21] Ingest con api_key invalida (404)"
 parse_response "$(do_request POST "$BASE_URL/api/v1/ingest/clave_falsa_12345" '{"test": true}')"
 check "POST /ingest con key invalida" 404 "$CODE" "$BODY"
 echo ""
 
-# --- 20. Eliminar campo -----------------------------------------------------
-echo "[20] Eliminar campo"
+# --- 22. Eliminar campo -----------------------------------------------------
+echo "[22] Eliminar campo"
 parse_response "$(do_request DELETE "$BASE_URL/api/v1/admin/fields/$FIELD_ID")"
 check "DELETE /admin/fields/{id}" 204 "$CODE" "$BODY"
 echo ""
 
-# --- 21. Soft-delete cuenta --------------------------------------------------
-echo "[21] Soft-delete cuenta de prueba"
+# --- 23. Soft-delete cuenta --------------------------------------------------
+echo "[23] Soft-delete cuenta de prueba"
 parse_response "$(do_request DELETE "$BASE_URL/api/v1/admin/accounts/$ACCOUNT_ID")"
 check "DELETE /admin/accounts/{id}" 204 "$CODE" "$BODY"
 echo ""
 
-# --- 22. Ingest a cuenta desactivada ----------------------------------------
-echo "[22] Ingest a cuenta desactivada (404)"
+# --- 24. Ingest a cuenta desactivada ----------------------------------------
+echo "[24] Ingest a cuenta desactivada (404)"
 parse_response "$(do_request POST "$BASE_URL/api/v1/ingest/$API_KEY" '{"test": true}')"
 check "POST /ingest cuenta inactiva" 404 "$CODE" "$BODY"
 echo ""